@@ -19,19 +19,14 @@ the changes in frequency have been applied?
 """
 
 
-def get_resultant_frequency(input_changes):
+def get_resultant_frequency(changes):
     """
-    Use the strings from input_changes to
+    Add up the integer changes to
     get the resultant frequency
     """
-    result = 0
-
-    for change in input_changes:
-        result += int(change)
-
-    return result
+    return sum(changes)
 
 
 if __name__ == "__main__":
     with open('input.txt') as input_changes:
-        print(get_resultant_frequency(input_changes))
+        print(get_resultant_frequency(map(int, input_changes)))
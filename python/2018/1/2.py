@@ -23,28 +23,26 @@ middle of processing the list.
 What is the first frequency your device reaches twice?
 """
 import itertools
-from collections import Counter
 
 
-def get_result_appears_twice(input_changes):
+def get_result_appears_twice(changes):
     """
-    Apply changes from input_changes to a result
+    Apply the integer changes to a result
     and see which one appears twice
     """
-    result = 0
-    results_cnt = Counter({0: 1})
+    seen_results = set()
 
-    for change in itertools.cycle(input_changes):
-        result += int(change)
-
-        results_cnt[result] += 1
-
-        if results_cnt[result] == 2:
+    # Let accumulate and cycle do the running sum in C so that the loop
+    # body only has to check each result.
+    for result in itertools.accumulate(itertools.cycle(changes), initial=0):
+        if result in seen_results:
             return result
 
+        seen_results.add(result)
+
     return None
 
 
 if __name__ == "__main__":
     with open('input.txt') as input_changes:
-        print(get_result_appears_twice(input_changes))
+        print(get_result_appears_twice(list(map(int, input_changes))))
@@ -133,10 +133,11 @@ be much longer and will take many more seconds to appear.
 
 What message will eventually appear in the sky?
 """
-from common import parse_point_info_str, find_coherent_message, render
+from common import (find_coherent_message, parse_point_info_str, render,
+                    to_points)
 
 if __name__ == "__main__":
     with open('input.txt') as point_info_str_list:
-        point_info_list = list(map(parse_point_info_str, point_info_str_list))
-        _, message_points = find_coherent_message(point_info_list)
+        points = to_points(map(parse_point_info_str, point_info_str_list))
+        _, message_points = find_coherent_message(points)
         render(message_points)
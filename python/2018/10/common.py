@@ -1,51 +1,57 @@
-import operator as op
 import re
+from collections import namedtuple
 
+# Each field holds one coordinate for every point, so ticking and bounding
+# work on whole columns at a time instead of rebuilding a tuple per point.
+Points = namedtuple("Points", ["xs", "ys", "vel_xs", "vel_ys"])
+
+POINT_INFO_REGEX = re.compile(r"position=< *(-*\d+)," +
+                              r" *(-*\d+) *>" +
+                              r" *velocity=< *(-*\d+),"
+                              r" *(-*\d+) *>")
 
-def parse_point_info_str(point_info_str):
-    parts_regex = re.compile(r"position=< *(?P<pos_x>-*\d+)," +
-                             r" *(?P<pos_y>-*\d+) *>" +
-                             r" *velocity=< *(?P<vel_x>-*\d+),"
-                             r" *(?P<vel_y>-*\d+) *>")
 
-    result = parts_regex.match(point_info_str)
+def parse_point_info_str(point_info_str):
+    result = POINT_INFO_REGEX.match(point_info_str)
 
     if not result:
         raise ValueError(
             f"String {point_info_str} doesn't look like a point info string")
 
-    groups = result.groupdict()
+    pos_x, pos_y, vel_x, vel_y = map(int, result.groups())
 
-    return ((int(groups['pos_x']), int(groups['pos_y'])),
-            (int(groups['vel_x']), int(groups['vel_y'])))
+    return ((pos_x, pos_y), (vel_x, vel_y))
 
 
-def tick(point_info_list):
-    def add_vel_to_point(point_info):
-        pos, vel = point_info
-        return (tuple(map(op.add, pos, vel)), vel)
+def to_points(point_info_list):
+    positions, velocities = zip(*point_info_list)
+    xs, ys = zip(*positions)
+    vel_xs, vel_ys = zip(*velocities)
 
-    return list(map(add_vel_to_point, point_info_list))
+    return Points(list(xs), list(ys), list(vel_xs), list(vel_ys))
 
 
-def get_positions(point_info_list):
-    return list(map(op.itemgetter(0), point_info_list))
+def tick(points, seconds=1):
+    def move(positions, velocities):
+        return [p + seconds * v for p, v in zip(positions, velocities)]
 
+    return points._replace(xs=move(points.xs, points.vel_xs),
+                           ys=move(points.ys, points.vel_ys))
 
-def get_bounds(point_positions):
-    min_row = min(point_positions, key=op.itemgetter(0))[0]
-    max_row = max(point_positions, key=op.itemgetter(0))[0]
-    min_column = min(point_positions, key=op.itemgetter(1))[1]
-    max_column = max(point_positions, key=op.itemgetter(1))[1]
 
-    return (min_row, max_row, min_column, max_column)
+def get_positions(points):
+    return set(zip(points.xs, points.ys))
 
 
-def render(point_info_list):
-    point_positions = get_positions(point_info_list)
+def get_bounds(points):
+    return (min(points.xs), max(points.xs), min(points.ys), max(points.ys))
+
+
+def render(points):
+    point_positions = get_positions(points)
 
     min_row, max_row, min_column, max_column =\
-        get_bounds(point_positions)
+        get_bounds(points)
 
     for column in range(min_column, max_column + 1):
         for row in range(min_row, max_row + 1):
@@ -56,24 +62,48 @@ def render(point_info_list):
         print()
 
 
-def find_coherent_message(point_info_list):
-    def area(bounds):
+def estimate_convergence_time(points):
+    """
+    Every point moves in a straight line, so the sum of their squared
+    distances from the centroid is a quadratic in time. Its minimum is
+    close to the moment the points line up.
+    """
+    numerator, denominator = 0, 0
+
+    for positions, velocities in ((points.xs, points.vel_xs),
+                                  (points.ys, points.vel_ys)):
+        mean_pos = sum(positions) / len(positions)
+        mean_vel = sum(velocities) / len(velocities)
+
+        numerator += sum((p - mean_pos) * (v - mean_vel)
+                         for p, v in zip(positions, velocities))
+        denominator += sum((v - mean_vel) ** 2 for v in velocities)
+
+    if not denominator:
+        return 0
+
+    return max(0, round(-numerator / denominator))
+
+
+def find_coherent_message(points):
+    def area(points):
         min_row, max_row, min_column, max_column =\
-            bounds
+            get_bounds(points)
         return (max_row - min_row) * (max_column - min_column)
 
-    prev_bounds = get_bounds(get_positions(point_info_list))
-    prev_info_list = point_info_list
+    seconds = estimate_convergence_time(points)
+    points = tick(points, seconds)
 
-    seconds = 0
+    # The estimate can be off by a second or so, so walk whichever way the
+    # area keeps shrinking.
+    for step in (1, -1):
+        while seconds + step >= 0:
+            next_points = tick(points, step)
 
-    while True:
-        seconds += 1
-        info_list = tick(prev_info_list)
-        bounds = get_bounds(get_positions(info_list))
+            if area(next_points) >= area(points):
+                break
 
-        if area(bounds) > area(prev_bounds):
-            return (seconds - 1, prev_info_list)
+            seconds += step
+            points = next_points
 
-        prev_info_list = info_list
-        prev_bounds = bounds
+    return (seconds, points)
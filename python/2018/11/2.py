@@ -17,24 +17,38 @@ is 12x12 and has a top-left corner of 232,251, so its identifier is 232,251,12.
 
 What is the X,Y,size identifier of the square with the largest total power?
 """
-from collections import defaultdict
+from itertools import accumulate
+from multiprocessing import Pool
+from operator import add
 
 serial = int(open("input.txt").read())
-grid_sums, partial_sums = {}, defaultdict(int)
 
 power_level = lambda x, y: ((((x + 10) * y + serial) * (x + 10)) // 10 ** 2 % 10) - 5
-calculate_ps = lambda x, y: (power_level(x + 1, y + 1)
-                             + partial_sums[x, y-1] + partial_sums[x-1, y] - partial_sums[x-1, y-1])
 
-for j in range(300):
-    for i in range(300):
-        partial_sums[(i, j)] = calculate_ps(i, j)
-
-for size in range(2, 300):
-    for j in range(size-1, 300):
-        for i in range(size-1, 300):
-            gp = partial_sums[(i, j)] + partial_sums[(i-size, j-size)] \
-                 - partial_sums[(i-size, j)] - partial_sums[(i, j-size)]
-            grid_sums[gp] = (i-size+2, j-size+2, size)
-
-print(grid_sums[max(grid_sums)])
+# Accumulate a whole row of power levels at a time and add it onto the
+# running column totals, instead of building each partial sum from three
+# of its neighbours. Row and column 0 are left as zero padding.
+partial_sums = [[0] * 301]
+for y in range(1, 301):
+    row_sums = accumulate(power_level(x, y) for x in range(1, 301))
+    partial_sums.append([0, *map(add, partial_sums[-1][1:], row_sums)])
+
+
+def best_square(size):
+    best_gp, best_coords = None, None
+    for j in range(size, 301):
+        top, bottom = partial_sums[j-size], partial_sums[j]
+        for i in range(size, 301):
+            gp = bottom[i] + top[i-size] - bottom[i-size] - top[i]
+            if best_gp is None or gp > best_gp:
+                best_gp, best_coords = gp, (i-size+1, j-size+1, size)
+    return best_gp, best_coords
+
+
+if __name__ == "__main__":
+    # Every size can be scanned independently, so spread them across cores
+    # and only keep the best square each one finds.
+    with Pool() as pool:
+        _, best_coords = max(pool.map(best_square, range(1, 301)))
+
+    print(best_coords)
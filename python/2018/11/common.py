@@ -1,5 +1,6 @@
 import operator as op
 from collections import namedtuple
+from itertools import accumulate
 
 Point = namedtuple("Point", ["x", "y"])
 
@@ -10,12 +11,8 @@ def get_power_level(point, grid_serial_number):
     power_level += grid_serial_number
     power_level *= rack_id
 
-    power_level_str = str(power_level)
-
-    if len(power_level_str) >= 3:
-        power_level = int(power_level_str[-3])
-    else:
-        power_level = 0
+    # Keep only the hundreds digit
+    power_level = power_level // 100 % 10
 
     power_level -= 5
 
@@ -28,17 +25,20 @@ def iter_all_points(grid_size):
             yield Point(column, row)
 
 
+def iter_area_points(grid_size, area_size):
+    """Yields every top-left point of an area that fits inside the grid."""
+    return iter_all_points((grid_size[0] - area_size[0] + 1,
+                            grid_size[1] - area_size[1] + 1))
+
+
 def iter_areas(grid_size, area_size):
     def get_area(point):
         for column in range(point.x, point.x + area_size[1]):
             for row in range(point.y, point.y + area_size[0]):
-                if (column <= grid_size[1]) and (row <= grid_size[0]):
-                    yield Point(column, row)
+                yield Point(column, row)
 
-    for point in iter_all_points(grid_size):
-        area = list(get_area(point))
-        if len(area) == (area_size[0] * area_size[1]):
-            yield area
+    for point in iter_area_points(grid_size, area_size):
+        yield list(get_area(point))
 
 
 def get_power_levels(grid_size, grid_serial_number):
@@ -48,11 +48,31 @@ def get_power_levels(grid_size, grid_serial_number):
     }
 
 
+def get_partial_sums(grid_size, grid_serial_number):
+    """
+    Returns a table where [y][x] is the total power of every cell at or above
+    and to the left of (x, y). Row and column 0 are zero padding.
+    """
+    partial_sums = [[0] * (grid_size[1] + 1)]
+
+    for row in range(1, grid_size[0] + 1):
+        row_sums = accumulate(
+            get_power_level(Point(column, row), grid_serial_number)
+            for column in range(1, grid_size[1] + 1))
+        partial_sums.append([0, *map(op.add, partial_sums[-1][1:], row_sums)])
+
+    return partial_sums
+
+
 def find_largest_total_power(grid_size, area_size, grid_serial_number):
-    area_sums = {
-        area[0]: sum(
-            get_power_level(point, grid_serial_number)
-            for point in area)
-        for area in iter_areas(grid_size, area_size)
-    }
-    return max(area_sums.items(), key=op.itemgetter(1))
+    partial_sums = get_partial_sums(grid_size, grid_serial_number)
+
+    def area_sum(point):
+        top, bottom = point.y - 1, point.y + area_size[0] - 1
+        left, right = point.x - 1, point.x + area_size[1] - 1
+        return (partial_sums[bottom][right] - partial_sums[top][right] -
+                partial_sums[bottom][left] + partial_sums[top][left])
+
+    return max(((point, area_sum(point))
+                for point in iter_area_points(grid_size, area_size)),
+               key=op.itemgetter(1))
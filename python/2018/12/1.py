@@ -99,76 +99,25 @@ produces 325.
 After 20 generations, what is the sum of the numbers of all pots which contain
 a plant?
 """
-import itertools
-import re
-
-import more_itertools
-from sortedcontainers import SortedDict
-
-from common import render
-
-
-def parse_point_info(pot_info):
-    def parse_pot_list(pots_str):
-        return list(c == '#' for c in pots_str)
-
-    initial_pots_regex =\
-        re.compile(r"initial state: *(?P<init_pots>[#.]+)")
-
-    change_rules_regex =\
-        re.compile(r"(?P<start>[#.]+) *=> *(?P<result>[#.])")
-
-    initial_pots =\
-        parse_pot_list(initial_pots_regex.match(pot_info[0]).groups()[0])
-
-    initial_pots = SortedDict(enumerate(initial_pots))
-
-    change_rules = {
-        tuple(parse_pot_list(start)): parse_pot_list(result)[0]
-        for start, result in
-        [change_rules_regex.match(rule).groups() for rule in pot_info[1:]]
-    }
-
-    return (initial_pots, change_rules)
-
-
-def tick(state, change_rules):
-    # For this generation, pots 2 before
-    # as well as 2 after might be affected
-    min_, max_ = min(state), max(state)
-    state[min_ - 1], state[min_ - 2] = (False, ) * 2
-    state[max_ + 1], state[max_ + 2] = (False, ) * 2
-
-    state_with_surrounding_points =\
-        list(more_itertools.stagger(
-            state.values(), offsets=tuple(range(-2, 3)),
-            longest=True,
-            fillvalue=False))[:-1]
-
-    result_state = SortedDict()
-
-    for i, surrounding_points in zip(state.keys(),
-                                     state_with_surrounding_points):
-        if surrounding_points in change_rules:
-            result_state[i] = change_rules[surrounding_points]
-        else:
-            result_state[i] = False
-
-    return result_state
-
+from common import parse_point_info, tick, render, plant_positions
 
 if __name__ == "__main__":
     with open('input.txt') as pot_info:
         pot_info = filter(None, map(lambda s: s.strip(), pot_info.readlines()))
         initial_state, change_rules = parse_point_info(list(pot_info))
 
+        # Plants can spread at most 2 pots left each generation, so this is
+        # far enough left to fit every row
+        generations = 20
+        origin = initial_state[1] - 2 * generations
+
         state = initial_state
-        for i in range(20):
+        for i in range(generations):
             state = tick(state, change_rules)
             print(f"{i}:", end=' ')
-            render(state)
+            render(state, origin)
 
         print("Final:", end=' ')
-        render(state)
+        render(state, origin)
 
-        print(sum(itertools.compress(state.keys(), state.values())))
+        print(sum(plant_positions(state)))
@@ -6,30 +6,34 @@ your future.
 After fifty billion (50000000000) generations, what is the sum of the numbers
 of all pots which contain a plant?
 """
-import itertools
+from common import parse_point_info, tick, plant_positions
 
-# There is an exploitable pattern in this particular input sequence, after gen
-# >= 102. The pattern always goes True three times, False three times, except
-# for the last 10 numbers, which are False two times, and True three times.
-# The only thing that changes is the whole pattern shifts around. You can tell
-# which positions the point starts and ends at deterministically as well.
 
-# This pattern is generated by Advent of Code and seems unique to each person,
-# which is why the value seems so arbritary.
+def find_plant_sum(state, change_rules, generations):
+    """
+    After enough generations the plants settle into a shape that only slides
+    along the pots by the same amount every generation, so once the pots
+    stop changing the rest can be extrapolated instead of simulated.
+    """
+    prev_pots, prev_first_pot = None, None
 
-if __name__ == "__main__":
-    needed_gen = 50000000000
-    starting = needed_gen - 34
-    ending = needed_gen + 98
+    for gen in range(generations):
+        pots, first_pot = state
+
+        if pots == prev_pots:
+            shift = first_pot - prev_first_pot
+            plants = list(plant_positions(state))
+            return sum(plants) + len(plants) * shift * (generations - gen)
+
+        prev_pots, prev_first_pot = state
+        state = tick(state, change_rules)
 
-    state = dict(
-        itertools.takewhile(lambda kv: kv[0] <= ending - 10,
-                            ((i + starting, value) for i, value in enumerate(
-                                itertools.cycle([True] * 3 + [False] * 3)))))
+    return sum(plant_positions(state))
 
-    state.update(
-        dict(
-            zip(range(ending - 9, ending + 1),
-                ([False] * 2 + [True] * 3) * 2)))
 
-    print(sum(list(k for k, v in state.items() if v)))
+if __name__ == "__main__":
+    with open('input.txt') as pot_info:
+        pot_info = filter(None, map(lambda s: s.strip(), pot_info.readlines()))
+        initial_state, change_rules = parse_point_info(list(pot_info))
+
+        print(find_plant_sum(initial_state, change_rules, 50000000000))
@@ -1,2 +1,98 @@
-def render(state):
-    print(''.join('^' if p else '`' for p in state.values()))
+import re
+
+
+def parse_point_info(pot_info):
+    def parse_pot_list(pots_str):
+        return list(c == '#' for c in pots_str)
+
+    def pack_pot_list(pots):
+        return sum(1 << i for i, pot in enumerate(pots) if pot)
+
+    initial_pots_regex =\
+        re.compile(r"initial state: *(?P<init_pots>[#.]+)")
+
+    change_rules_regex =\
+        re.compile(r"(?P<start>[#.]+) *=> *(?P<result>[#.])")
+
+    initial_pots =\
+        parse_pot_list(initial_pots_regex.match(pot_info[0]).groups()[0])
+
+    # The state is a bit-vector of pots together with the number of the pot
+    # at bit 0.
+    initial_state = trim((pack_pot_list(initial_pots), 0))
+
+    # Rules are indexed by their five pots packed the same way, with the
+    # leftmost pot as the lowest bit.
+    change_rules = [False] * 32
+
+    for rule in pot_info[1:]:
+        start, result = change_rules_regex.match(rule).groups()
+        change_rules[pack_pot_list(parse_pot_list(start))] =\
+            parse_pot_list(result)[0]
+
+    return (initial_state, change_rules)
+
+
+def trim(state):
+    # Drop the empty pots at the start so that bit 0 is always the first
+    # plant and the vector never grows past the plants themselves.
+    pots, first_pot = state
+    empty_pots = (pots & -pots).bit_length() - 1
+
+    if empty_pots < 0:
+        return state
+
+    return (pots >> empty_pots, first_pot + empty_pots)
+
+
+def tick(state, change_rules):
+    # For this generation, pots 2 before
+    # as well as 2 after might be affected
+    pots, first_pot = state
+    pots, first_pot = pots << 2, first_pot - 2
+    all_pots = (1 << (pots.bit_length() + 2)) - 1
+
+    # neighbours[k] lines up the pot k - 2 places away with every pot
+    neighbours = [pots << 2, pots << 1, pots, pots >> 1, pots >> 2]
+
+    # Every pot whose surroundings match a planting rule is found at once by
+    # masking the whole vector against that rule, bit by bit.
+    result_pots = 0
+
+    for pattern, result in enumerate(change_rules):
+        if not result:
+            continue
+
+        matches = all_pots
+
+        for k, neighbour in enumerate(neighbours):
+            matches &= neighbour if pattern >> k & 1 else ~neighbour
+
+        result_pots |= matches
+
+    return trim((result_pots, first_pot))
+
+
+def iter_pots(pots):
+    # Reading the bits off a single binary string avoids shifting the whole
+    # vector once per pot.
+    return (bit == '1' for bit in reversed(bin(pots)[2:] if pots else ''))
+
+
+def plant_positions(state):
+    pots, first_pot = state
+    return (first_pot + i for i, pot in enumerate(iter_pots(pots)) if pot)
+
+
+def render(state, origin=0):
+    # Rows are drawn from a fixed origin pot rather than the first plant, so
+    # that pots line up from one generation to the next. Anything to the left
+    # of the origin is cut off.
+    pots, first_pot = state
+    empty_pots = first_pot - origin
+
+    if empty_pots < 0:
+        pots, empty_pots = pots >> -empty_pots, 0
+
+    print('`' * empty_pots +
+          ''.join('^' if pot else '`' for pot in iter_pots(pots)))
@@ -1,4 +1,3 @@
-import functools
 import itertools
 import operator as op
 from collections import namedtuple
@@ -36,96 +35,78 @@ class CellTypes(Enum):
 Cell = namedtuple("Cell", ["location", "type_"])
 
 
-@functools.total_ordering
 class Cart:
+    # Which of the surrounding points a cart moves to in each direction
+    _SURROUNDING_POINT_INDEXES = {
+        CartDirections.UP: 0,
+        CartDirections.DOWN: 1,
+        CartDirections.LEFT: 2,
+        CartDirections.RIGHT: 3
+    }
+
+    # The direction a cart faces after entering a cell of each type while
+    # going in a given direction, for every cell that isn't an intersection
+    _TRANSITIONS = {
+        (CartDirections.UP, CellTypes.VERTICAL): CartDirections.UP,
+        (CartDirections.DOWN, CellTypes.VERTICAL): CartDirections.DOWN,
+        (CartDirections.LEFT, CellTypes.HORIZONTAL): CartDirections.LEFT,
+        (CartDirections.RIGHT, CellTypes.HORIZONTAL): CartDirections.RIGHT,
+        (CartDirections.UP, CellTypes.FORWARD_CURVE): CartDirections.RIGHT,
+        (CartDirections.DOWN, CellTypes.FORWARD_CURVE): CartDirections.LEFT,
+        (CartDirections.LEFT, CellTypes.FORWARD_CURVE): CartDirections.DOWN,
+        (CartDirections.RIGHT, CellTypes.FORWARD_CURVE): CartDirections.UP,
+        (CartDirections.UP, CellTypes.BACKWARD_CURVE): CartDirections.LEFT,
+        (CartDirections.DOWN, CellTypes.BACKWARD_CURVE): CartDirections.RIGHT,
+        (CartDirections.LEFT, CellTypes.BACKWARD_CURVE): CartDirections.UP,
+        (CartDirections.RIGHT, CellTypes.BACKWARD_CURVE): CartDirections.DOWN
+    }
+
+    # The turns a cart takes at successive intersections: left, straight on,
+    # then right
+    _INTERSECTION_LOOP = [{
+        CartDirections.UP: CartDirections.LEFT,
+        CartDirections.DOWN: CartDirections.RIGHT,
+        CartDirections.LEFT: CartDirections.DOWN,
+        CartDirections.RIGHT: CartDirections.UP
+    }, {
+        direction: direction
+        for direction in CartDirections
+    }, {
+        CartDirections.UP: CartDirections.RIGHT,
+        CartDirections.DOWN: CartDirections.LEFT,
+        CartDirections.LEFT: CartDirections.UP,
+        CartDirections.RIGHT: CartDirections.DOWN
+    }]
+
     def __init__(self, location, direction):
         self.location, self.direction = location, direction
 
-        self._intersection_loop = [
-            CartDirections.LEFT, None, CartDirections.RIGHT
-        ]
         self._next_intersection_direction_index = 0
 
     def tick(self, surrounding_points):
-        self.location, new_cell_type = {
-            CartDirections.UP: surrounding_points[0],
-            CartDirections.DOWN: surrounding_points[1],
-            CartDirections.LEFT: surrounding_points[2],
-            CartDirections.RIGHT: surrounding_points[3]
-        }[self.direction]
+        self.location, new_cell_type =\
+            surrounding_points[
+                self._SURROUNDING_POINT_INDEXES[self.direction]]
 
         self.direction = self._get_direction_for_cell(new_cell_type)
 
     def _get_direction_for_cell(self, cell_type):
-        if cell_type == CellTypes.NONE:
-            raise ValueError("Cannot travel with no tracks")
-
-        elif cell_type == CellTypes.VERTICAL:
-            if self.direction in (CartDirections.UP, CartDirections.DOWN):
-                return self.direction
-            else:
-                raise ValueError(
-                    f"Cannot go {self.direction.name} on a vertical")
-
-        elif cell_type == CellTypes.HORIZONTAL:
-            if self.direction in (CartDirections.LEFT, CartDirections.RIGHT):
-                return self.direction
-            else:
-                raise ValueError(
-                    f"Cannot go {self.direction.name} on a horizontal")
-
-        elif cell_type == CellTypes.FORWARD_CURVE:
-            return {
-                CartDirections.UP: CartDirections.RIGHT,
-                CartDirections.DOWN: CartDirections.LEFT,
-                CartDirections.LEFT: CartDirections.DOWN,
-                CartDirections.RIGHT: CartDirections.UP
-            }[self.direction]
-
-        elif cell_type == CellTypes.BACKWARD_CURVE:
-            return {
-                CartDirections.UP: CartDirections.LEFT,
-                CartDirections.DOWN: CartDirections.RIGHT,
-                CartDirections.LEFT: CartDirections.UP,
-                CartDirections.RIGHT: CartDirections.DOWN
-            }[self.direction]
-
-        elif cell_type == CellTypes.INTERSECTION:
-            intersection_direction =\
-                self._intersection_loop[
+        if cell_type == CellTypes.INTERSECTION:
+            intersection_turns =\
+                self._INTERSECTION_LOOP[
                     self._next_intersection_direction_index]
 
             self._next_intersection_direction_index =\
                 (self._next_intersection_direction_index + 1)\
-                % len(self._intersection_loop)
-
-            if not intersection_direction:
-                return self.direction
-            elif intersection_direction == CartDirections.LEFT:
-                return {
-                    CartDirections.UP: CartDirections.LEFT,
-                    CartDirections.DOWN: CartDirections.RIGHT,
-                    CartDirections.LEFT: CartDirections.DOWN,
-                    CartDirections.RIGHT: CartDirections.UP
-                }[self.direction]
-            elif intersection_direction == CartDirections.RIGHT:
-                return {
-                    CartDirections.UP: CartDirections.RIGHT,
-                    CartDirections.DOWN: CartDirections.LEFT,
-                    CartDirections.LEFT: CartDirections.UP,
-                    CartDirections.RIGHT: CartDirections.DOWN
-                }[self.direction]
-
-    def __lt__(self, other):
-        if self == other:
-            return False
-
-        other_location = self._comparision_operand_converter(other)
-
-        other_further_right = self.location[0] < other_location[0]
-        other_further_down = self.location[1] < other_location[1]
-
-        return other_further_down or other_further_right
+                % len(self._INTERSECTION_LOOP)
+
+            return intersection_turns[self.direction]
+
+        try:
+            return self._TRANSITIONS[(self.direction, cell_type)]
+        except KeyError:
+            raise ValueError(
+                f"Cannot go {self.direction.name} on a {cell_type.name}")
 
     def __eq__(self, other):
         return self.location == self._comparision_operand_converter(other)
@@ -172,25 +153,28 @@ class TrackGrid:
 
     def tick(self, remove_duplicates=False):
         crashed_carts = []
+        carts_by_location = {cart.location: cart for cart in self.carts}
 
-        for cart in sorted(self.carts):
-            if cart in crashed_carts:
+        # Carts move in reading order: top to bottom, then left to right
+        for cart in sorted(self.carts,
+                           key=lambda c: (c.location[1], c.location[0])):
+            if carts_by_location.get(cart.location) is not cart:
                 continue
 
+            del carts_by_location[cart.location]
             cart.tick(self._get_surrounding_points(cart.location))
 
-            index = self.carts.index(cart)
-            carts_without_current =\
-                [c for i, c in enumerate(self.carts) if i != index]
+            other_cart = carts_by_location.pop(cart.location, None)
 
-            if cart in carts_without_current:
+            if other_cart:
                 crashed_carts.append(cart)
-                crashed_carts.append(
-                    carts_without_current[carts_without_current.index(cart)])
+                crashed_carts.append(other_cart)
+            else:
+                carts_by_location[cart.location] = cart
 
         if remove_duplicates:
-            self.carts =\
-                [c for c in self.carts if c not in crashed_carts]
+            self.carts = [c for c in self.carts
+                          if carts_by_location.get(c.location) is c]
 
         return crashed_carts
 
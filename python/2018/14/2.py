@@ -11,21 +11,11 @@ whose scores are the digits from your puzzle input.
 How many recipes appear on the scoreboard to the left of the score sequence in
 your puzzle input?
 """
-from common import gen_scores
-
-# This one should be run with PyPy3.5 if you want a sub-15 second answer
-# Regular Python needs >20 seconds to do this
+from common import find_score_sequence
 
 if __name__ == "__main__":
     with open('input.txt') as score_sequence:
         score_sequence =\
             list(map(int, score_sequence.read().strip()))
 
-        scores = []
-
-        for n in gen_scores(2, [3, 7]):
-            scores.append(n)
-
-            if scores[-len(score_sequence):] == score_sequence:
-                print(len(scores) - len(score_sequence))
-                break
+        print(find_score_sequence(2, [3, 7], score_sequence))
@@ -1,26 +1,69 @@
-import itertools
+def make_recipes(scores, current_indexes, rounds):
+    """
+    Runs the given number of rounds of recipes, appending the new scores to
+    the scores bytearray and moving the elves' current_indexes in place.
+    """
+    elves = range(len(current_indexes))
+
+    for _ in range(rounds):
+        sum_ = 0
+        for i in current_indexes:
+            sum_ += scores[i]
+
+        if sum_ >= 10:
+            scores.extend(divmod(sum_, 10))
+        else:
+            scores.append(sum_)
+
+        length = len(scores)
+
+        for elf in elves:
+            i = current_indexes[elf]
+            current_indexes[elf] = (i + scores[i] + 1) % length
+
 
 def gen_scores(num_elves, initial):
     if len(initial) != num_elves:
         raise ValueError(
             f"There are {num_elves} elves, but only {len(initial)} elements")
 
-    list_ = initial
-    current_indexes = list(itertools.islice(itertools.count(), 0, num_elves))
+    # A bytearray holds each score in a single byte and grows in amortized
+    # steps, rather than keeping a full object reference per score.
+    scores = bytearray(initial)
+    current_indexes = list(range(num_elves))
 
-    yield from list_
+    yield from scores
 
     while True:
-        current_elements = [list_[i] for i in current_indexes]
+        length = len(scores)
+        make_recipes(scores, current_indexes, 1)
+
+        yield from scores[length:]
+
 
-        sum_ = sum(current_elements)
-        new_elements = divmod(sum_, 10) if sum_ >= 10 else (sum_,)
+def find_score_sequence(num_elves, initial, score_sequence):
+    """
+    Returns how many scores are made before score_sequence first appears.
+
+    This is the same process as gen_scores, but the scores are only searched
+    for the sequence after every batch of recipes, so the search itself
+    happens in C rather than once per score.
+    """
+    if len(initial) != num_elves:
+        raise ValueError(
+            f"There are {num_elves} elves, but only {len(initial)} elements")
+
+    scores = bytearray(initial)
+    score_sequence = bytes(score_sequence)
+    current_indexes = list(range(num_elves))
+    search_from = 0
+
+    while True:
+        make_recipes(scores, current_indexes, 100000)
 
-        yield from new_elements
+        found = scores.find(score_sequence, search_from)
 
-        list_.extend(new_elements)
+        if found != -1:
+            return found
 
-        current_indexes = [
-            (i + list_[i] + 1) % len(list_)
-            for i in current_indexes
-        ]
+        search_from = len(scores) - len(score_sequence) + 1
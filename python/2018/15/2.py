@@ -86,10 +86,13 @@ After increasing the Elves' attack power until it is just barely enough
 for them to win without any Elves dying, what is the outcome of the combat
 described in your puzzle input?
 """
-import itertools
-from copy import deepcopy
+from functools import partial
+from multiprocessing import Pool
 
-from common import CombatGrid, UnitTypes
+from common import DEFAULT_ATTACK_POWER, UNIT_HP, CombatGrid, UnitTypes
+
+# The elves only need help if they can't already win without a death
+MIN_ELF_ATTACK_POWER = DEFAULT_ATTACK_POWER + 1
 
 
 class ElfDeath(Exception):
@@ -97,7 +100,7 @@ class ElfDeath(Exception):
 
 
 class CombatGridElfDeath(CombatGrid):
-    def modify_elf_power(self, value=3):
+    def modify_elf_power(self, value=DEFAULT_ATTACK_POWER):
         for elf in filter(lambda unit: unit.type_ == UnitTypes.ELF,
                           self.units):
             elf.attack_power = value
@@ -112,30 +115,58 @@ class CombatGridElfDeath(CombatGrid):
         return target
 
 
+def attempt_battle(combat_grid_original, elf_attack_power):
+    """
+    Fights a copy of the given grid with the elves at the given attack power,
+    returning the number of full rounds and the final grid if no elf died.
+    """
+    combat_grid = combat_grid_original.copy()
+    combat_grid.modify_elf_power(elf_attack_power)
+
+    full_rounds = 0
+
+    try:
+        while combat_grid.tick():
+            full_rounds += 1
+    except ElfDeath:
+        return None
+
+    return (full_rounds, combat_grid)
+
+
 if __name__ == "__main__":
     with open('input.txt') as combat_grid_strings:
         combat_grid_original =\
             CombatGridElfDeath.from_combat_grid_strings(
                 combat_grid_strings.read().splitlines())
 
-        for elf_attack_power in itertools.count(4):
-            try:
-                combat_grid = deepcopy(combat_grid_original)
-                combat_grid.modify_elf_power(elf_attack_power)
+        # Whether the elves survive isn't monotonic in their attack power,
+        # so powers can't be binary searched. But a battle only depends on how
+        # many hits it takes to kill a goblin, so only the lowest power for
+        # each number of hits needs trying. Those battles are independent, so
+        # they're fought across cores, taking the weakest power that wins.
+        elf_attack_powers = sorted(
+            {-(-UNIT_HP // hits_to_kill)
+             for hits_to_kill in
+             range(1, -(-UNIT_HP // MIN_ELF_ATTACK_POWER) + 1)})
+
+        with Pool() as pool:
+            battles = pool.imap(partial(attempt_battle, combat_grid_original),
+                                elf_attack_powers)
 
-                full_rounds = 0
+            winner =\
+                next(((elf_attack_power, battle) for elf_attack_power, battle
+                      in zip(elf_attack_powers, battles) if battle), None)
 
-                while combat_grid.tick():
-                    full_rounds += 1
+        # The strongest power tried kills a goblin in one hit, and any more
+        # power than that fights exactly the same battle
+        if not winner:
+            raise ValueError("Elves can't win without losing anyone")
 
-                print(
-                    f"Elves win with attack power {elf_attack_power}",
-                    end="\n")
-                combat_grid.render()
+        elf_attack_power, (full_rounds, combat_grid) = winner
 
-                print("Outcome:",
-                      full_rounds * sum(unit.hp for unit in combat_grid.units))
+        print(f"Elves win with attack power {elf_attack_power}", end="\n")
+        combat_grid.render()
 
-                break
-            except ElfDeath:
-                continue
+        print("Outcome:",
+              full_rounds * sum(unit.hp for unit in combat_grid.units))
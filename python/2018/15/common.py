@@ -1,43 +1,24 @@
-import functools
-import heapq
 import operator as op
-from collections import namedtuple
 from enum import Enum
 
 
-@functools.total_ordering
-class Location(namedtuple("Location", ["x", "y"])):
-    def __lt__(self, other):
-        other = self._operand_converter(other)
+# Locations are packed into a single int with the row above the column, so
+# that comparing them gives reading order and every neighbour is a fixed
+# offset away.
+ROW = 1 << 16
 
-        if self.y < other.y:
-            return True
-        elif other.y < self.y:
-            return False
+# Every unit starts out with these, though elves can be given more power
+UNIT_HP = 200
+DEFAULT_ATTACK_POWER = 3
 
-        if self.x < other.x:
-            return True
-        elif other.x < self.x:
-            return False
 
-    def __eq__(self, other):
-        other = self._operand_converter(other)
+def to_location(x, y):
+    return y * ROW + x
 
-        return (self.x == other.x) and (self.y == other.y)
 
-    def _operand_converter(self, other):
-        if isinstance(other, Location):
-            return other
-        elif isinstance(other, (tuple, list)):
-            return Location(other[0], other[1])
-        else:
-            raise ValueError(
-                f"Value of {type(other)} cannot be compared with a Location")
-
-    def __str__(self):
-        return f"({self.x}, {self.y})"
-
-    __repr__ = __str__
+def format_location(location):
+    y, x = divmod(location, ROW)
+    return f"({x}, {y})"
 
 
 class EnvironmentTypes(Enum):
@@ -48,21 +29,6 @@ class EnvironmentTypes(Enum):
         return self.value
 
 
-class Environment:
-    def __init__(self, location, type_=EnvironmentTypes.OPEN):
-        self.location = location
-
-        if isinstance(type_, EnvironmentTypes):
-            self.type_ = type_
-        else:
-            raise ValueError(f"Environment must have a valid type")
-
-    def __str__(self):
-        return f"{self.type_} @ {self.location}"
-
-    __repr__ = __str__
-
-
 class UnitTypes(Enum):
     ELF = 'E'
     GOBLIN = 'G'
@@ -72,78 +38,59 @@ class UnitTypes(Enum):
 
 
 class Unit:
-    def __init__(self, location, type_, hp=200, attack_power=3):
+    def __init__(self, location, type_, hp=UNIT_HP,
+                 attack_power=DEFAULT_ATTACK_POWER):
         self.location = location
-        self._hp, self.attack_power = hp, attack_power
+        self.hp, self.attack_power = hp, attack_power
 
         if isinstance(type_, UnitTypes):
             self.type_ = type_
         else:
             raise ValueError(f"Unit must have a valid type")
 
-    # Provide a way to break ties for the find_move function below. As the
-    # description says, first the shortest paths matter, then the reading order
-    # for the destination, then the reading order for the beginning.
-    # Defined here to both make it clear it's not needed for the outside
-    # program, and to avoid to overhead of making it every time find_move is
-    # called.
-    class CellNode(
-            namedtuple("CellNode", ["distance", "cell", "starting_cell"])):
-        def __lt__(self, other):
-            if self == other:
-                return False
-
-            if self.distance == other.distance:
-                if self.cell.location == other.cell.location:
-                    return (self.starting_cell.location <
-                            other.starting_cell.location)
-                return self.cell.location < other.cell.location
-            return self.distance < other.distance
-
-        def __eq__(self, other):
-            return (
-                self.distance == other.distance
-                and self.cell.location == other.cell.location and
-                self.starting_cell.location == other.starting_cell.location)
+    def find_move(self, adjacent_cells_func, targets):
+        # Search outwards one distance at a time until reaching one of the
+        # target locations. Each layer maps a location to the first step of
+        # the shortest path there that comes first in reading order, which is
+        # how the description breaks ties between paths once the closest
+        # target (also in reading order) is known.
+        layer = {}
 
-    def find_move(self, surrounding_cells_func):
-        frontier = []
-        explored = {self}
+        for location, cell in adjacent_cells_func(self.location):
+            if self.is_enemy(cell):
+                return None
 
-        for cell in surrounding_cells_func(self):
-            if not cell or cell.type_ != EnvironmentTypes.OPEN:
-                if self.is_enemy(cell):
-                    return None
+            if cell == EnvironmentTypes.OPEN:
+                layer[location] = location
 
-                continue
+        explored = {self.location}
 
-            heapq.heappush(frontier, self.CellNode(1, cell, cell))
+        while layer:
+            in_range = layer.keys() & targets
 
-        while frontier:
-            next_ = heapq.heappop(frontier)
+            if in_range:
+                return layer[min(in_range)]
 
-            for cell in surrounding_cells_func(next_.cell):
-                if not cell or cell in explored:
-                    continue
+            explored.update(layer)
 
-                if cell.type_ != EnvironmentTypes.OPEN:
-                    if self.is_enemy(cell):
-                        return next_.starting_cell.location
+            next_layer = {}
 
-                    continue
+            for location, first_step in layer.items():
+                for next_location, cell in adjacent_cells_func(location):
+                    if (cell == EnvironmentTypes.OPEN
+                            and next_location not in explored):
+                        next_layer[next_location] = min(
+                            first_step,
+                            next_layer.get(next_location, first_step))
 
-                heapq.heappush(
-                    frontier,
-                    self.CellNode(next_.distance + 1, cell,
-                                  next_.starting_cell))
-                explored.add(cell)
+            layer = next_layer
 
         return None
 
-    def find_attack(self, surrounding_cells_func):
+    def find_attack(self, adjacent_cells_func):
         surrounding_enemies =\
             [cell
-             for cell in surrounding_cells_func(self)
+             for _, cell in adjacent_cells_func(self.location)
              if self.is_enemy(cell)]
 
         if not surrounding_enemies:
@@ -152,57 +99,69 @@ class Unit:
         return min(
             surrounding_enemies, key=lambda cell: (cell.hp, cell.location))
 
-    @property
-    def hp(self):
-        return self._hp
-
-    @hp.setter
-    def hp(self, value):
-        if value > self._hp:
-            raise ValueError(f"You cannot increase a unit's HP.")
-        else:
-            self._hp = value
-
     def is_enemy(self, other):
         return isinstance(other, Unit) and self.type_ != other.type_
 
     def __str__(self):
-        return f"{self.type_}({self.hp}) @ {self.location}"
+        return f"{self.type_}({self.hp}) @ {format_location(self.location)}"
 
     __repr__ = __str__
 
 
 class CombatGrid:
-    def __init__(self, grid, units):
-        self._grid, self.units = grid, units
+    def __init__(self, open_locations, size, units, verbose=False):
+        self._open_locations, self._size = open_locations, size
+        self.verbose = verbose
+
+        # Units are only ever iterated in a freshly sorted order, so a set
+        # makes removing them and checking if they're alive O(1)
+        self.units = set(units)
+        self._unit_at = {unit.location: unit for unit in units}
 
     @classmethod
-    def from_combat_grid_strings(cls, combat_grid_strings):
-        grid = [[None for _ in range(len(row))] for row in combat_grid_strings]
+    def from_combat_grid_strings(cls, combat_grid_strings, verbose=False):
+        open_locations = set()
         units = []
 
         for i, line in enumerate(combat_grid_strings):
             for j, char in enumerate(line):
-                location = Location(j, i)
+                location = to_location(j, i)
 
                 if char in EnvironmentTypes._value2member_map_:
-                    grid[i][j] = Environment(location, EnvironmentTypes(char))
+                    if EnvironmentTypes(char) == EnvironmentTypes.WALL:
+                        continue
                 else:
                     units.append(Unit(location, UnitTypes(char)))
-                    grid[i][j] = Environment(location)
 
-        return cls(grid, units)
+                open_locations.add(location)
+
+        size = (max(map(len, combat_grid_strings)), len(combat_grid_strings))
+
+        return cls(frozenset(open_locations), size, units, verbose)
+
+    def copy(self):
+        """
+        Returns a grid whose units can fight independently of this one's. The
+        map itself never changes, so it's shared rather than copied.
+        """
+        return type(self)(
+            self._open_locations, self._size,
+            [Unit(unit.location, unit.type_, unit.hp, unit.attack_power)
+             for unit in self.units],
+            self.verbose)
 
     def _attempt_attack(self, unit):
         possible_attack = unit.find_attack(self.get_adjacent_cells)
 
         if possible_attack:
-            print(f"{unit} attacks {possible_attack}")
+            if self.verbose:
+                print(f"{unit} attacks {possible_attack}")
 
             possible_attack.hp -= unit.attack_power
 
             if possible_attack.hp <= 0:
                 self.units.remove(possible_attack)
+                del self._unit_at[possible_attack.location]
 
         return possible_attack
 
@@ -218,54 +177,64 @@ class CombatGrid:
             if self._attempt_attack(unit):
                 continue
 
-            possible_move = unit.find_move(self.get_adjacent_cells)
+            targets = self._find_targets(unit)
+
+            if not targets:
+                continue
+
+            possible_move = unit.find_move(self.get_adjacent_cells, targets)
 
             if possible_move:
-                print(f"{unit} moves to {possible_move}")
+                if self.verbose:
+                    print(f"{unit} moves to "
+                          f"{format_location(possible_move)}")
+
+                del self._unit_at[unit.location]
                 unit.location = possible_move
+                self._unit_at[unit.location] = unit
                 self._attempt_attack(unit)
 
         return True
 
+    def _find_targets(self, unit):
+        """Returns every open location next to one of the unit's enemies."""
+        return {
+            location
+            for enemy in self.units if unit.is_enemy(enemy)
+            for location, cell in self.get_adjacent_cells(enemy.location)
+            if cell == EnvironmentTypes.OPEN
+        }
+
     def render(self):
-        for line in self:
+        width, height = self._size
+
+        for y in range(height):
             units_in_row = []
 
-            for item in line:
+            for x in range(width):
+                item = self[to_location(x, y)]
+
                 if isinstance(item, Unit):
                     units_in_row.append(item)
+                    item = item.type_
 
-                print(item.type_, end='')
+                print(item, end='')
 
             print("\t", end='')
             print(', '.join(map(str, units_in_row)))
 
-    def get_adjacent_cells(self, cell):
-        location = cell.location
-
-        return (self.get((location.x, location.y - 1)),
-                self.get((location.x, location.y + 1)),
-                self.get((location.x - 1, location.y)),
-                self.get((location.x + 1, location.y)))
-
-    def __getitem__(self, key):
-        if not isinstance(key, (tuple, list)):
-            if key < 0:
-                raise IndexError
-
-            return [self[i, key] for i in range(len(self._grid[key]))]
+    def get_adjacent_cells(self, location):
+        # The map is always surrounded by walls, so a unit is never next to
+        # the edge and its neighbours don't need bounds checks
+        return [(adjacent_location, self[adjacent_location])
+                for adjacent_location in (location - ROW, location - 1,
+                                          location + 1, location + ROW)]
 
-        if any(i < 0 for i in key):
-            raise IndexError
+    def __getitem__(self, location):
+        if location in self._unit_at:
+            return self._unit_at[location]
 
-        try:
-            return self.units[list(map(op.attrgetter('location'),
-                                       self.units)).index(key)]
-        except ValueError:
-            return self._grid[key[1]][key[0]]
+        if location in self._open_locations:
+            return EnvironmentTypes.OPEN
 
-    def get(self, key, default=None):
-        try:
-            return self[key]
-        except IndexError:
-            return default
+        return EnvironmentTypes.WALL
@@ -5,35 +5,50 @@ the test program (the second section of your puzzle input).
 What value is contained in register 0 after executing the test program?
 """
 import more_itertools
-from common import ELFCODE_FUNCTIONS, Sample, Instruction
+from common import ELFCODE_FUNCTIONS, Sample, Instruction, compile_program
 
 def find_correct_behaviours(samples):
-    behaviours = [set(ELFCODE_FUNCTIONS.keys()) for _ in range(16)]
+    # Each opcode's candidates are a bitmask over the names, in the order of
+    # ELFCODE_FUNCTIONS, so narrowing them down is just integer arithmetic.
+    names = list(ELFCODE_FUNCTIONS.keys())
+    behaviours = [(1 << len(names)) - 1] * 16
+
+    funcs = list(ELFCODE_FUNCTIONS.values())
+    regs = [0] * 4
 
     for sample in samples:
-        behaves_like = set(name for name, func in ELFCODE_FUNCTIONS.items()
-                           if sample.behaves_like(func))
+        opcode = sample.instruction.opcode
+        candidates = behaviours[opcode]
 
-        behaviours[sample.instruction.opcode] &= behaves_like
+        # Only names that are still possible for this opcode need checking
+        for i, func in enumerate(funcs):
+            if candidates >> i & 1 and\
+                    not sample.behaves_like_into(func, regs):
+                candidates &= ~(1 << i)
 
-    while True:
-        indx = []
-        unique = set()
+        behaviours[opcode] = candidates
+
+    propagated = 0
 
-        for i, b in enumerate(behaviours):
-            if len(b) == 1:
-                unique.add(list(b)[0])
-                indx.append(i)
+    while True:
+        # Masks with a single bit set are resolved, so that bit can be
+        # cleared from every other opcode
+        unique = [b for b in behaviours
+                  if b and b & (b - 1) == 0 and not b & propagated]
 
-        if len(unique) == len(behaviours):
+        if not unique:
             break
 
         for u in unique:
-            for i, b in enumerate(behaviours):
-                if i not in indx:
-                    b.discard(u)
+            propagated |= u
+            behaviours = [b if b == u else b & ~u for b in behaviours]
+
+    # Anything left without exactly one bit set either matched nothing or
+    # couldn't be narrowed down, and either way has no single name
+    if any(b == 0 or b & (b - 1) for b in behaviours):
+        raise ValueError("Samples don't resolve every opcode to one behaviour")
 
-    return [s.pop() for s in behaviours]
+    return [names[b.bit_length() - 1] for b in behaviours]
 
 
 if __name__ == "__main__":
@@ -48,12 +63,8 @@ if __name__ == "__main__":
             program =\
                 list(map(Instruction.from_str, program.readlines()))
 
-            regs = [0] * 4
-
-            for instruction in program:
-                regs =\
-                    ELFCODE_FUNCTIONS[
-                        behaviours[instruction.opcode]](regs,
-                                                        *instruction.params)
+            run = compile_program(
+                (behaviours[instruction.opcode], instruction.params)
+                for instruction in program)
 
-            print(regs[0])
+            print(run([0] * 4)[0])
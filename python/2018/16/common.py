@@ -61,6 +61,53 @@ ELFCODE_FUNCTIONS = {
 }
 
 
+# The same operations as source templates, where {a} and {b} are the
+# immediate values and {ra} and {rb} the registers they name. Used to compile
+# instructions into plain Python instead of going through the closures above.
+ELFCODE_EXPRESSIONS = {
+    "addr": "{ra} + {rb}", "addi": "{ra} + {b}",
+    "mulr": "{ra} * {rb}", "muli": "{ra} * {b}",
+    "banr": "{ra} & {rb}", "bani": "{ra} & {b}",
+    "borr": "{ra} | {rb}", "bori": "{ra} | {b}",
+    "setr": "{ra}", "seti": "{a}",
+    "gtir": "int({a} > {rb})", "gtri": "int({ra} > {b})",
+    "gtrr": "int({ra} > {rb})",
+    "eqir": "int({a} == {rb})", "eqri": "int({ra} == {b})",
+    "eqrr": "int({ra} == {rb})",
+}
+
+
+def compile_statement(name, a, b, c, register):
+    """
+    Generates the source of a single assignment for an instruction, with
+    register(i) giving the source for register i.
+    """
+    expression = ELFCODE_EXPRESSIONS[name].format(
+        a=a, b=b, ra=register(a), rb=register(b))
+
+    return f"{register(c)} = {expression}"
+
+
+def compile_program(named_instructions, num_regs=4):
+    """
+    Compiles a straight-line list of (name, params) pairs into one function
+    that takes and returns the registers, keeping them in local variables
+    while it runs.
+    """
+    registers = ", ".join(f"r{i}" for i in range(num_regs))
+
+    lines = ["def run(regs):", f"    {registers}, = regs"]
+    lines.extend(
+        "    " + compile_statement(name, *params, register=lambda i: f"r{i}")
+        for name, params in named_instructions)
+    lines.append(f"    return [{registers}]")
+
+    namespace = {}
+    exec("\n".join(lines), namespace)
+
+    return namespace["run"]
+
+
 @attr.s
 class Instruction:
     opcode = attr.ib(factory=int)
@@ -99,4 +146,12 @@ class Sample:
         return cls(before, instruction, after)
 
     def behaves_like(self, func):
-        return func(self.before[:], *self.instruction.params) == self.after
+        return self.behaves_like_into(func, [0] * len(self.before))
+
+    def behaves_like_into(self, func, regs):
+        """
+        Like behaves_like, but runs func on the given register list instead
+        of a fresh copy, so one list can be reused across many checks.
+        """
+        regs[:] = self.before
+        return func(regs, *self.instruction.params) == self.after
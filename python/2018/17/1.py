@@ -186,6 +186,6 @@ if __name__ == "__main__":
             itertools.chain.from_iterable(
                 map(locations_from_range, clay_coordinate_ranges.readlines())))
 
-        ground = GroundGrid(clay, flowing_water={Location(500, 0)})
+        ground = GroundGrid(clay, springs={Location(500, 0)})
 
         print(flow(ground)[1])
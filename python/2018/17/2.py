@@ -18,6 +18,6 @@ if __name__ == "__main__":
             itertools.chain.from_iterable(
                 map(locations_from_range, clay_coordinate_ranges.readlines())))
 
-        ground = GroundGrid(clay, flowing_water={Location(500, 0)})
+        ground = GroundGrid(clay, springs={Location(500, 0)})
 
         print(len(flow(ground)[0].still_water))
@@ -1,4 +1,3 @@
-import itertools
 import operator as op
 from collections import namedtuple
 from copy import copy
@@ -30,22 +29,24 @@ class Location(namedtuple("Location", ["x", "y"])):
     __repr__ = __str__
 
 
+# What each cell of the ground holds, as stored in GroundGrid's bytearray
+SAND, CLAY, FLOWING_WATER, STILL_WATER = range(4)
+
+# Maps cells water can't flow into to 1 and the rest to 0, for translate
+BLOCKED_TABLE = bytes(int(cell_type in (CLAY, STILL_WATER))
+                      for cell_type in range(256))
+
+
 @attr.s
 class GroundGrid:
     clay = attr.ib(
         factory=frozenset, validator=attr.validators.instance_of(frozenset))
 
-    flowing_water = attr.ib(
-        factory=set,
-        validator=attr.validators.optional(attr.validators.instance_of(set)))
-
-    still_water = attr.ib(
+    springs = attr.ib(
         factory=set,
         validator=attr.validators.optional(attr.validators.instance_of(set)))
 
     def __attrs_post_init__(self):
-        self._current_tips = copy(self.flowing_water)
-
         x_list = list(map(op.attrgetter('x'), self.clay))
         y_list = list(map(op.attrgetter('y'), self.clay))
 
@@ -55,95 +56,126 @@ class GroundGrid:
         self._min_y, self._max_y =\
             min(y_list), max(y_list)
 
+        # The whole ground is one flat array of cells, row after row, with a
+        # column of sand either side for the water spilling over the edges.
+        self._x_offset = self._min_x - 1
+        self._width = self._max_x - self._min_x + 3
+        self._cells = bytearray(self._width * (self._max_y + 1))
+
+        for cell in self.clay:
+            self._cells[self._index(cell)] = CLAY
+
+        self._current_tips = set(map(self._index, self.springs))
+
+        for cell in self._current_tips:
+            self._cells[cell] = FLOWING_WATER
+
+    @property
+    def flowing_water(self):
+        return self._locations_of(FLOWING_WATER)
+
+    @property
+    def still_water(self):
+        return self._locations_of(STILL_WATER)
+
+    def is_flowing(self):
+        return bool(self._current_tips)
+
+    def count_water(self):
+        # Only the rows from the highest clay down count
+        start = self._min_y * self._width
+
+        return (self._cells.count(FLOWING_WATER, start) +
+                self._cells.count(STILL_WATER, start))
+
     def tick(self):
+        # Tips are indexes into the cells, so moving around is arithmetic:
+        # one row down is one width further along.
         for water_tip in copy(self._current_tips):
             self._current_tips.discard(water_tip)
 
-            up, down, left, right = self.get_adjacent_cells(water_tip)
+            down = water_tip + self._width
+
+            if down >= len(self._cells):
+                continue
 
             if self._flowable(down):
                 self._current_tips.add(down)
-                self.flowing_water.add(down)
+                self._cells[down] = FLOWING_WATER
 
                 continue
 
-            furthest_left, furthest_right =\
-                (self._furthest_flowable_cell(left, -1),
-                 self._furthest_flowable_cell(right, 1))
+            left_flows, furthest_left =\
+                self._furthest_flowable_cell(water_tip - 1, -1)
+            right_flows, furthest_right =\
+                self._furthest_flowable_cell(water_tip + 1, 1)
+
+            cell_type =\
+                FLOWING_WATER if left_flows or right_flows else STILL_WATER
 
-            row = frozenset(
-                itertools.chain(
-                    (Location(x, water_tip.y)
-                     for x in range(water_tip.x, furthest_left[1].x - 1, -1)),
-                    (Location(x, water_tip.y)
-                     for x in range(water_tip.x + 1, furthest_right[1].x +
-                                    1))))
+            self._cells[furthest_left:furthest_right + 1] =\
+                bytes((cell_type,)) * (furthest_right + 1 - furthest_left)
 
-            if furthest_left[0] or furthest_right[0]:
-                self.flowing_water |= row
+            if left_flows:
+                self._current_tips.add(furthest_left)
 
-                if furthest_left[0]:
-                    self._current_tips.add(furthest_left[1])
+            if right_flows:
+                self._current_tips.add(furthest_right)
 
-                if furthest_right[0]:
-                    self._current_tips.add(furthest_right[1])
-            else:
-                self.still_water |= row
-                self.flowing_water -= row
-                self._current_tips.add(up)
+            if cell_type == STILL_WATER:
+                self._current_tips.add(water_tip - self._width)
 
     def _furthest_flowable_cell(self, cell, direction):
-        if not self._flowable(cell):
-            return (False, Location(cell.x - direction, cell.y))
+        """
+        Scans along the row from the given cell for the nearest wall and the
+        nearest cell with nothing to hold water up below it. Returns whether
+        the water falls off before hitting a wall, and the last cell it
+        reaches.
+        """
+        row = cell - cell % self._width
+        x = cell - row
 
-        while True:
-            _, down, left, right = self.get_adjacent_cells(cell)
+        blocked, below_blocked = (
+            self._cells[start:start + self._width].translate(BLOCKED_TABLE)
+            for start in (row, row + self._width))
 
-            if self._flowable(down):
-                return (True, cell)
+        if direction == 1:
+            wall, drop = blocked.find(1, x), below_blocked.find(0, x)
 
-            next_cell = left if direction == -1 else right
+            if drop != -1 and (wall == -1 or drop < wall):
+                return (True, row + drop)
 
-            if not self._flowable(next_cell):
-                return (False, cell)
+            return (False, row + wall - 1)
 
-            cell = next_cell
+        wall, drop =\
+            blocked.rfind(1, 0, x + 1), below_blocked.rfind(0, 0, x + 1)
 
-    def is_out_of_bounds(self, cell):
-        return not (self._min_y <= cell.y <= self._max_y)
+        if drop > wall:
+            return (True, row + drop)
 
-    def _flowable(self, cell):
-        return not (cell in self.clay or cell in self.still_water)
+        return (False, row + wall + 1)
+
+    def _index(self, cell):
+        return cell.y * self._width + cell.x - self._x_offset
 
-    def get_adjacent_cells(self, cell):
-        return (Location(cell.x, cell.y - 1), Location(cell.x, cell.y + 1),
-                Location(cell.x - 1, cell.y), Location(cell.x + 1, cell.y))
+    def _locations_of(self, type_):
+        return frozenset(
+            Location(i % self._width + self._x_offset, i // self._width)
+            for i, cell_type in enumerate(self._cells) if cell_type == type_)
+
+    def _flowable(self, cell):
+        return self._cells[cell] in (SAND, FLOWING_WATER)
 
     def render(self):
-        all_x = {
-            *map(op.attrgetter('x'), self.flowing_water | self.still_water),
-            self._min_x, self._max_x
-        }
-
-        all_y = {
-            *map(op.attrgetter('y'), self.flowing_water | self.still_water),
-            self._min_y, self._max_y
-        }
-
-        for y in range(min(all_y), max(all_y) + 1):
-            for x in range(min(all_x), max(all_x) + 1):
-                loc = (x, y)
-
-                if loc in self.clay:
-                    print(u'▓', end='')
-                elif loc in self._current_tips:
+        symbols = {SAND: ' ', CLAY: u'▓', FLOWING_WATER: u'¦',
+                   STILL_WATER: u'−'}
+
+        for y in range(self._max_y + 1):
+            for cell in range(y * self._width, (y + 1) * self._width):
+                if cell in self._current_tips:
                     print('+', end='')
-                elif loc in self.still_water:
-                    print('−', end='')
-                elif loc in self.flowing_water:
-                    print('¦', end='')
                 else:
-                    print(' ', end='')
+                    print(symbols[self._cells[cell]], end='')
 
             print()
 
@@ -162,20 +194,7 @@ def locations_from_range(coordinate_range_str):
 
 
 def flow(ground):
-    prev_num_water = 0
-
-    while True:
+    while ground.is_flowing():
         ground.tick()
 
-        num_water = len(
-            frozenset(
-                filter(lambda c: not ground.is_out_of_bounds(c),
-                       ground.flowing_water | ground.still_water)))
-
-        if num_water == 0:
-            continue
-
-        if num_water == prev_num_water:
-            return (ground, num_water)
-
-        prev_num_water = num_water
+    return (ground, ground.count_water())
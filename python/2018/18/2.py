@@ -6,24 +6,29 @@ if __name__ == "__main__":
 
         lumber_grid = LumberGrid.from_str_list(lumber_strs)
 
-        values = []
+        values, seen_states = [], {}
 
         # This is similar to Day 12 in that there's a loop in the input that we
-        # can exploit to calculate up to this large of a number
-
+        # can exploit to calculate up to this large of a number, so remember
+        # every state until one comes back around
         REQUIRED_NUM = 1000000000
-        PERIODICITY = 28
-        FIRST_STABLE = 627
-        FIRST_STABLE_LOOPS_TO = 599
 
-        for i in range(FIRST_STABLE + PERIODICITY):
-            lumber_grid.tick()
+        for minute in range(REQUIRED_NUM + 1):
+            state = tuple(map(tuple, lumber_grid.grid))
+
+            if state in seen_states:
+                loop_start = seen_states[state]
+                periodicity = minute - loop_start
 
-            value =\
-                (lumber_grid.type_counts[CellTypes.TREE] *
-                 lumber_grid.type_counts[CellTypes.LUMBERYARD])
+                print(values[loop_start +
+                             (REQUIRED_NUM - loop_start) % periodicity])
+                break
 
-            values.append(value)
+            seen_states[state] = minute
 
-        print(values[(((REQUIRED_NUM - 1) - FIRST_STABLE) % PERIODICITY) +
-                     FIRST_STABLE_LOOPS_TO])
+            values.append(lumber_grid.type_counts[CellTypes.TREE] *
+                          lumber_grid.type_counts[CellTypes.LUMBERYARD])
+
+            lumber_grid.tick()
+        else:
+            print(values[-1])
@@ -1,34 +1,9 @@
-from collections import Counter, namedtuple
-from copy import copy
+from collections import Counter
 from enum import Enum
 
 import attr
 
 
-class Location(namedtuple("Location", ["x", "y"])):
-    def __eq__(self, other):
-        other = self._operand_converter(other)
-
-        return (self.x == other.x) and (self.y == other.y)
-
-    def _operand_converter(self, other):
-        if isinstance(other, Location):
-            return other
-        elif isinstance(other, (tuple, list)):
-            return Location(other[0], other[1])
-        else:
-            raise ValueError(
-                f"Value of {type(other)} cannot be compared with a Location")
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __str__(self):
-        return f"({self.x}, {self.y})"
-
-    __repr__ = __str__
-
-
 class CellTypes(Enum):
     OPEN = '.'
     TREE = '|'
@@ -38,30 +13,41 @@ class CellTypes(Enum):
         return self.value
 
 
-@attr.s
-class Cell:
-    type_ = attr.ib()
-    location = attr.ib()
-
-    def tick(self, surrounding_cells):
-        surrounding_trees =\
-            list(filter(lambda c: c and c.type_ == CellTypes.TREE,
-                        surrounding_cells))
-
-        if self.type_ == CellTypes.OPEN:
-            if len(surrounding_trees) >= 3:
-                self.type_ = CellTypes.TREE
-        else:
-            surrounding_yards =\
-                list(filter(lambda c: c and c.type_ == CellTypes.LUMBERYARD,
-                            surrounding_cells))
-
-            if self.type_ == CellTypes.TREE:
-                if len(surrounding_yards) >= 3:
-                    self.type_ = CellTypes.LUMBERYARD
-            else:
-                if not (surrounding_yards and surrounding_trees):
-                    self.type_ = CellTypes.OPEN
+# Both counts are packed into one number so that a single pass over the grid
+# counts them together. A block has at most 9 cells, so 16 keeps them apart.
+BLOCK_COUNT_WEIGHTS = {
+    CellTypes.OPEN: 0,
+    CellTypes.TREE: 1,
+    CellTypes.LUMBERYARD: 16,
+}
+
+
+def next_cell_type(type_, block_count):
+    # The counts are over the 3x3 block around the cell, including itself,
+    # which only matters for a lumberyard needing another lumberyard nearby
+    yard_count, tree_count = divmod(block_count, 16)
+
+    if type_ == CellTypes.OPEN:
+        if tree_count >= 3:
+            return CellTypes.TREE
+    elif type_ == CellTypes.TREE:
+        if yard_count >= 3:
+            return CellTypes.LUMBERYARD
+    else:
+        if not (yard_count >= 2 and tree_count >= 1):
+            return CellTypes.OPEN
+
+    return type_
+
+
+# next_cell_type for every type and every possible packed count, so ticking
+# a cell is a lookup instead of unpacking its counts and branching on them
+NEXT_CELL_TYPES = {
+    type_: [next_cell_type(type_, block_count)
+            for block_count in range(10 * BLOCK_COUNT_WEIGHTS[
+                CellTypes.LUMBERYARD])]
+    for type_ in CellTypes
+}
 
 
 @attr.s
@@ -71,56 +57,56 @@ class LumberGrid:
 
     def __attrs_post_init__(self):
         for line in self:
-            for cell in line:
-                self.type_counts[cell.type_] += 1
+            self.type_counts.update(line)
 
     def tick(self):
-        self.type_counts.clear()
+        new_grid = []
 
-        new_grid = [[None for _ in range(len(row))] for row in self.grid]
+        for line, count_line in zip(self.grid, self._count_blocks()):
+            new_line = [NEXT_CELL_TYPES[type_][block_count]
+                        for type_, block_count in zip(line, count_line)]
 
-        for i, line in enumerate(self):
-            for j, cell in enumerate(line):
-                cell = copy(cell)
-                cell.tick(self._get_surrounding_cells(cell))
+            # Only the cells that changed type move the counts, and whole
+            # lines that didn't change can be skipped with one comparison
+            if new_line != line:
+                for old_type, new_type in zip(line, new_line):
+                    if old_type is not new_type:
+                        self.type_counts[old_type] -= 1
+                        self.type_counts[new_type] += 1
 
-                new_grid[i][j] = cell
-
-                self.type_counts[cell.type_] += 1
+            new_grid.append(new_line)
 
         self.grid = new_grid
 
     def render(self):
         for line in self:
-            for cell in line:
-                print(str(cell.type_), end='')
+            for type_ in line:
+                print(str(type_), end='')
 
             print()
 
-    def _get_surrounding_cells(self, cell):
-        loc = cell.location
+    def _count_blocks(self):
+        """
+        Counts the trees and lumberyards in the 3x3 block around every cell,
+        packed as in BLOCK_COUNT_WEIGHTS, by summing each row in threes and
+        then summing those sums in threes down the columns.
+        """
+        row_sums = [
+            list(map(sum, zip(padded, padded[1:], padded[2:])))
+            for padded in ([0, *map(BLOCK_COUNT_WEIGHTS.get, line), 0]
+                           for line in self)
+        ]
+
+        empty_sums = [[0] * len(row_sums[0])]
+        above, below = empty_sums + row_sums[:-1], row_sums[1:] + empty_sums
 
         return [
-            self.get((loc.x - 1, loc.y - 1)),
-            self.get((loc.x, loc.y - 1)),
-            self.get((loc.x + 1, loc.y - 1)),
-            self.get((loc.x - 1, loc.y)),
-            self.get((loc.x + 1, loc.y)),
-            self.get((loc.x - 1, loc.y + 1)),
-            self.get((loc.x, loc.y + 1)),
-            self.get((loc.x + 1, loc.y + 1)),
+            list(map(sum, zip(*rows))) for rows in zip(above, row_sums, below)
         ]
 
     @classmethod
     def from_str_list(cls, str_list):
-        grid = [[None for _ in range(len(row))] for row in str_list]
-
-        for i, line in enumerate(str_list):
-            for j, char in enumerate(line):
-                grid[i][j] = Cell(
-                    type_=CellTypes(char), location=Location(j, i))
-
-        return cls(grid)
+        return cls([list(map(CellTypes, line)) for line in str_list])
 
     def get(self, key, default=None):
         try:
@@ -93,7 +93,7 @@ the program, and so the program ends.
 What value is left in register 0 when the background process halts?
 """
 import re
-from common import ELFCODE_FUNCTIONS, Instruction
+from common import Instruction, compile_instruction
 
 if __name__ == "__main__":
     with open('input.txt') as instructions:
@@ -103,15 +103,12 @@ if __name__ == "__main__":
             int(re.match(r"#ip *(\d)", instructions[0]).groups()[0])
 
         instructions = list(map(Instruction.from_str, instructions[1:]))
+        compiled = list(map(compile_instruction, instructions))
 
         regs = [0] * 6
 
         while regs[instruction_pointer_index] < len(instructions):
-            instruction = instructions[regs[instruction_pointer_index]]
-
-            regs =\
-                ELFCODE_FUNCTIONS[instruction.opcode](regs,
-                                                      *instruction.params)
+            compiled[regs[instruction_pointer_index]](regs)
 
             regs[instruction_pointer_index] += 1
 
@@ -94,7 +94,7 @@ What value is left in register 0 when the background process halts?
 """
 import re
 import math
-from common import ELFCODE_FUNCTIONS, Instruction
+from common import Instruction, compile_instruction
 
 if __name__ == "__main__":
     with open('input.txt') as instructions:
@@ -104,6 +104,7 @@ if __name__ == "__main__":
             int(re.match(r"#ip *(\d)", instructions[0]).groups()[0])
 
         instructions = list(map(Instruction.from_str, instructions[1:]))
+        compiled = list(map(compile_instruction, instructions))
 
         regs = [1] + ([0] * 5)
 
@@ -129,11 +130,7 @@ if __name__ == "__main__":
                 print(sum_)
                 break
 
-            instruction = instructions[instruction_pointer]
-
-            regs =\
-                ELFCODE_FUNCTIONS[instruction.opcode](regs,
-                                                      *instruction.params)
+            compiled[instruction_pointer](regs)
 
             prev_pointer = instruction_pointer
 
@@ -61,6 +61,47 @@ ELFCODE_FUNCTIONS = {
 }
 
 
+# The same operations as source templates, where {a} and {b} are the
+# immediate values and {ra} and {rb} the registers they name. Used to compile
+# instructions into plain Python instead of going through the closures above.
+ELFCODE_EXPRESSIONS = {
+    "addr": "{ra} + {rb}", "addi": "{ra} + {b}",
+    "mulr": "{ra} * {rb}", "muli": "{ra} * {b}",
+    "banr": "{ra} & {rb}", "bani": "{ra} & {b}",
+    "borr": "{ra} | {rb}", "bori": "{ra} | {b}",
+    "setr": "{ra}", "seti": "{a}",
+    "gtir": "int({a} > {rb})", "gtri": "int({ra} > {b})",
+    "gtrr": "int({ra} > {rb})",
+    "eqir": "int({a} == {rb})", "eqri": "int({ra} == {b})",
+    "eqrr": "int({ra} == {rb})",
+}
+
+
+def compile_statement(name, a, b, c, register):
+    """
+    Generates the source of a single assignment for an instruction, with
+    register(i) giving the source for register i.
+    """
+    expression = ELFCODE_EXPRESSIONS[name].format(
+        a=a, b=b, ra=register(a), rb=register(b))
+
+    return f"{register(c)} = {expression}"
+
+
+def compile_instruction(instruction):
+    """
+    Compiles an instruction into a function that updates the registers in
+    place, without the closure calls of ELFCODE_FUNCTIONS.
+    """
+    statement = compile_statement(instruction.opcode, *instruction.params,
+                                  register=lambda i: f"regs[{i}]")
+
+    namespace = {}
+    exec(f"def run(regs):\n    {statement}", namespace)
+
+    return namespace["run"]
+
+
 @attr.s
 class Instruction:
     opcode = attr.ib()
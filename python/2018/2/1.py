@@ -36,17 +36,14 @@ def get_rudimentary_checsum(box_ids):
     exactly 2 characters, and those that contain exactly 3,
     and multiply those counts together.
     """
-    # Initialize one counter object in the beginning, so we won't be
-    # initializing counters for each iteration
-    cnt = Counter()
     num_contains_twos = 0
     num_contains_threes = 0
 
     for id_ in box_ids:
-        cnt.clear()
-        cnt.update(id_)
-
-        num_appearences = dict(cnt).values()
+        # A set of the counts, so both checks below are a hash lookup.
+        # Building a fresh Counter is done in C, so it's no slower than
+        # clearing and reusing one.
+        num_appearences = set(Counter(id_).values())
 
         if 2 in num_appearences:
             num_contains_twos += 1
@@ -60,5 +57,7 @@ def get_rudimentary_checsum(box_ids):
 
 
 if __name__ == "__main__":
-    with open('input.txt') as box_ids:
+    # Read as bytes, so the letters are counted as small ints rather than
+    # decoded into strings first
+    with open('input.txt', 'rb') as box_ids:
         print(get_rudimentary_checsum(box_ids))
@@ -18,36 +18,27 @@ What letters are common between the two correct box IDs? (In the example above,
 this is found by removing the differing character from either ID, producing
 fgij.)
 """
-import itertools
 
 
-def differs_by_one_char_same_len(str1, str2):
+def find_pair_differs_by_one_char(box_ids):
     """
-    Returns the index of the difference if the two strings have a difference in
-    exactly 1 place. Must be of the same length. Returns -1 otherwise.
+    Find a pair of ids that differ by only one character
     """
-    if len(str1) != len(str2):
-        raise ValueError("Strings aren't the same length")
+    box_ids = list(box_ids)
 
-    one_difference_found = False
-    found_index = 0
-    for i, (chr1, chr2) in enumerate(zip(str1, str2)):
-        if chr1 != chr2:
-            if one_difference_found:
-                return -1
-            one_difference_found = True
-            found_index = i
-    return found_index
+    # Two ids differ only at some index exactly when they're the same with
+    # that index cut out, so for each index look for a repeat among the cut
+    # ids instead of comparing every pair
+    for i in range(len(box_ids[0])):
+        seen = {}
 
+        for id_ in box_ids:
+            cut_id = id_[:i] + id_[i + 1:]
 
-def find_pair_differs_by_one_char(box_ids):
-    """
-    Find a pair of ids that differ by only one character
-    """
-    for str1, str2 in itertools.combinations(box_ids, r=2):
-        difference_result = differs_by_one_char_same_len(str1, str2)
-        if difference_result != -1:
-            return (difference_result, (str1, str2))
+            if cut_id in seen:
+                return (i, (seen[cut_id], id_))
+
+            seen[cut_id] = id_
     return None
 
 
@@ -1,29 +1,44 @@
+# Rooms are flattened into a single int, x + y * ROW, which is much cheaper
+# to hash and move around than an (x, y) tuple
+ROW = 1 << 16
+
 DIRECTIONS = {
-    'N': (0, 1),
-    'E': (1, 0),
-    'S': (0, -1),
-    'W': (-1, 0),
+    'N': ROW,
+    'E': 1,
+    'S': -ROW,
+    'W': -1,
 }
 
+# DIRECTIONS indexed by byte instead, with 0 for anything that isn't one
+STEPS = [0] * 256
+for direction, step in DIRECTIONS.items():
+    STEPS[ord(direction)] = step
+
+OPEN_GROUP, CLOSE_GROUP, BRANCH = b"()|"
+
 def parse_rooms_regex(rooms_regex):
-    grid = {(0, 0): 0}
-    dist = x = y = 0
+    grid = {0: 0}
+    dist = room = 0
     stack = []
 
-    for char in rooms_regex:
-        if char == '(':
-            stack.append((dist, x, y))
-        elif char == ')':
-            dist, x, y = stack.pop()
-        elif char == '|':
-            dist, x, y = stack[-1]
-        else:
-            dx, dy = DIRECTIONS[char]
-            x += dx
-            y += dy
+    for char in rooms_regex.encode():
+        # Directions are by far the most common characters, so they're
+        # recognised with a single lookup before trying any of the others
+        step = STEPS[char]
+
+        if step:
+            room += step
 
             dist += 1
-            if (x, y) not in grid or dist < grid[(x, y)]:
-                grid[(x, y)] = dist
+            if room not in grid or dist < grid[room]:
+                grid[room] = dist
+        elif char == OPEN_GROUP:
+            stack.append((dist, room))
+        elif char == CLOSE_GROUP:
+            dist, room = stack.pop()
+        elif char == BRANCH:
+            dist, room = stack[-1]
+        else:
+            raise ValueError(f"unexpected regex character {chr(char)!r}")
 
     return grid
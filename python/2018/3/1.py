@@ -56,16 +56,17 @@ while adjacent to the others, does not overlap either of them.)
 If the Elves all proceed with their own plans, none of them will have enough
 fabric. How many square inches of fabric are within two or more claims?
 """
-from common import all_overlap_squares, claims_from_claim_strings
+from common import claims_from_claim_strings, count_claims_per_square
 
 
 def overlapping_squares(claims):
-    claim_squares = (frozenset(claim.squares_occupied()) for claim in claims)
-    return set(all_overlap_squares(claim_squares))
+    """Counts the squares covered by two or more claims."""
+    return sum(len(row) - row.count(0) - row.count(1)
+               for row in count_claims_per_square(claims))
 
 
 if __name__ == "__main__":
     with open('input.txt') as claim_strings:
-        claims = claims_from_claim_strings(claim_strings)
+        claims = list(claims_from_claim_strings(claim_strings))
 
-        print(len(overlapping_squares(claims)))
+        print(overlapping_squares(claims))
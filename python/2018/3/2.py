@@ -8,36 +8,24 @@ made.
 
 What is the ID of the only claim that doesn't overlap?
 """
-from common import claims_from_claim_strings
+from common import claims_from_claim_strings, count_claims_per_square
 
 
 def find_non_overlapping_claims(claims):
     claims = list(claims)
-    occupied_squares = {
-        claim.id: frozenset(claim.squares_occupied())
-        for claim in claims
-    }
-    non_overlapping_claims = []
-    for claim in claims:
+    fabric = count_claims_per_square(claims)
 
-        # Check if this claim overlaps with any other claims
-        for other_claim in claims:
-            if claim.id == other_claim.id:
-                continue
+    # A claim doesn't overlap with any others if it's the only one covering
+    # every one of its squares
+    non_overlapping_claims = []
 
-            overlaps_with_this = frozenset.intersection(
-                occupied_squares[claim.id], occupied_squares[other_claim.id])
+    for claim in claims:
+        columns = claim.columns_occupied()
 
-            if overlaps_with_this:
-                # It does, no need to check further
-                break
-        else:
-            # This only happens if no break is encountered
+        if all(row[columns].count(1) == claim.width
+               for row in fabric[claim.rows_occupied()]):
             non_overlapping_claims.append(claim)
 
-        # This will only happen if a break is encountered, which means
-        # we just have to move on. Placing for clarity
-        continue
     return non_overlapping_claims
 
 
@@ -1,8 +1,10 @@
-import itertools
 import re
 from collections import namedtuple
 
-Square = namedtuple("Square", ["row", "column"])
+CLAIM_REGEX = re.compile(r"\#(?P<id>\d+)" + r" *@ *" +
+                         r"(?P<from_left>\d+)" + r" *, *" +
+                         r"(?P<from_top>\d+)" + r" *: *" +
+                         r"(?P<width>\d+)x(?P<height>\d+)")
 
 
 class Claim(
@@ -13,35 +15,25 @@ class Claim(
     @classmethod
     def from_string(cls, str_):
         """Returns a claim object corresponding to the given string."""
-        parts_regex = re.compile(r"\#(?P<id>\d+)" + r" *@ *" +
-                                 r"(?P<from_left>\d+)" + r" *, *" +
-                                 r"(?P<from_top>\d+)" + r" *: *" +
-                                 r"(?P<width>\d+)x(?P<height>\d+)")
-
-        result = parts_regex.match(str_)
+        result = CLAIM_REGEX.match(str_)
 
         if not result:
             raise ValueError(
                 f"String {str_} does not look like a claim string.")
 
-        groups = {k: int(v) for k, v in result.groupdict().items()}
+        return cls(*map(int, result.groups()))
+
+    def rows_occupied(self):
+        """Returns the slice of rows occupied by this claim."""
+        return slice(self.from_top, self.from_top + self.height)
 
-        return cls(**groups)
+    def columns_occupied(self):
+        """Returns the slice of columns occupied by this claim."""
+        return slice(self.from_left, self.from_left + self.width)
 
-    def squares_occupied(self):
-        """
-        Returns a generator of the coordinates of all squares
-        occupied by this claim.
-        """
-        top_left = Square(row=self.from_top, column=self.from_left)
-        top_right = Square(
-            row=top_left.row, column=(top_left.column + (self.width - 1)))
-        bottom_left = Square(
-            row=(top_left.row + (self.height - 1)), column=top_left.column)
 
-        for column in range(top_left.column, top_right.column + 1):
-            for row in range(top_left.row, bottom_left.row + 1):
-                yield Square(row=row, column=column)
+# Adds one to a count without letting it overflow, for bytearray.translate
+INCREMENT_TABLE = bytes(min(count + 1, 255) for count in range(256))
 
 
 def claims_from_claim_strings(claim_strings):
@@ -49,8 +41,20 @@ def claims_from_claim_strings(claim_strings):
         yield Claim.from_string(claim_string.strip())
 
 
-def all_overlap_squares(claim_squares):
-    for c1_sqs, c2_sqs in itertools.combinations(claim_squares, r=2):
-        overlaps = frozenset.intersection(c1_sqs, c2_sqs)
-        if overlaps:
-            yield from overlaps
+def count_claims_per_square(claims):
+    """
+    Returns the fabric as a list of rows, each a bytearray of how many of the
+    given claims cover each square in it.
+    """
+    width = max(claim.from_left + claim.width for claim in claims)
+    height = max(claim.from_top + claim.height for claim in claims)
+
+    fabric = [bytearray(width) for _ in range(height)]
+
+    for claim in claims:
+        columns = claim.columns_occupied()
+
+        for row in fabric[claim.rows_occupied()]:
+            row[columns] = row[columns].translate(INCREMENT_TABLE)
+
+    return fabric
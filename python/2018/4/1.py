@@ -71,28 +71,15 @@ analyzed.
 What is the ID of the guard you chose multiplied by the minute you chose? (In
 the above example, the answer would be 10 * 24 = 240.)
 """
-from collections import Counter
-
-import funcy as _
-
 from common import get_guard_minutes_asleep, parse_event_list
 
 
-def total_time_asleep(guard_id, guard_minutes_asleep):
-    timings = guard_minutes_asleep[guard_id].values()
-    return sum([len(mins) for mins in timings])
-
-
 def get_guard_asleep_most(guard_minutes_asleep):
-    all_times = {
-        guard_id: total_time_asleep(guard_id, guard_minutes_asleep)
-        for guard_id in guard_minutes_asleep.keys()
-    }
-
-    most_asleep_guard_id = max(all_times.keys(), key=(lambda k: all_times[k]))
+    most_asleep_guard_id = max(
+        guard_minutes_asleep.keys(),
+        key=(lambda k: sum(guard_minutes_asleep[k])))
 
-    return (most_asleep_guard_id,
-            list(guard_minutes_asleep[most_asleep_guard_id].values()))
+    return (most_asleep_guard_id, guard_minutes_asleep[most_asleep_guard_id])
 
 
 if __name__ == "__main__":
@@ -105,8 +92,6 @@ if __name__ == "__main__":
             get_guard_asleep_most(guard_minutes_asleep)
 
         most_common_minute =\
-            Counter(_.cat(daily_minutes
-                          for daily_minutes in minutes_asleep))\
-            .most_common(1)[0][0]
+            max(range(len(minutes_asleep)), key=minutes_asleep.__getitem__)
 
         print(most_asleep_guard_id * most_common_minute)
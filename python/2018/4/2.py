@@ -18,36 +18,22 @@ any minute asleep at most twice.)
 What is the ID of the guard you chose multiplied by the minute you chose? (In
 the above example, the answer would be 99 * 45 = 4455.)
 """
-from collections import Counter
+import itertools
 
 from common import get_guard_minutes_asleep, parse_event_list
 
 
 def most_common_minute(guard_minutes_asleep):
-    cnt = Counter()
-    most_common_minutes = {}
+    # Every guard's minutes laid end to end, so one max over all of them
+    # finds both the guard and the minute
+    guard_ids = list(guard_minutes_asleep.keys())
+    all_timings = list(itertools.chain.from_iterable(
+        guard_minutes_asleep[guard_id] for guard_id in guard_ids))
 
-    for guard_id, timings in guard_minutes_asleep.items():
-        timings = list(timings.values())
+    guard_index, minute = divmod(
+        max(range(len(all_timings)), key=all_timings.__getitem__), 60)
 
-        cnt.clear()
-        for set_ in timings:
-            cnt.update(set_)
-
-        most_common_minutes[guard_id] = cnt.most_common(1)[0]
-
-    # We end up with a dictionary with guard ids
-    # and a tuple as the key with (minute, frequency).
-    # We simply have to pick the minute with that appears
-    # the most out of those.
-
-    def key_by_minute_frequency(item):
-        return item[1][1]
-
-    most_common_guard_asleep =\
-        max(most_common_minutes.items(), key=key_by_minute_frequency)
-
-    return (most_common_guard_asleep[0], most_common_guard_asleep[1][0])
+    return (guard_ids[guard_index], minute)
 
 
 if __name__ == "__main__":
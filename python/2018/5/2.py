@@ -20,18 +20,25 @@ In this example, removing all C/c units was best, producing the answer 4.
 What is the length of the shortest polymer you can produce by removing all
 units of exactly one type and fully reacting the result?
 """
+from multiprocessing import Pool
+
 from common import react_polymer
 
 
 def optimize_polymer(polymer_str):
     units_to_try = set(polymer_str.lower())
-    all_polymers = []
+    polymers_without_unit = []
     for unit in units_to_try:
         remove_unit_translator =\
             str.maketrans({unit: None, unit.upper(): None})
-        polymer_without_unit = polymer_str.translate(remove_unit_translator)
+        polymers_without_unit.append(
+            polymer_str.translate(remove_unit_translator))
+
+    # Each polymer reacts independently of the others, so spread them
+    # across cores
+    with Pool() as pool:
+        all_polymers = pool.map(react_polymer, polymers_without_unit)
 
-        all_polymers.append(react_polymer(polymer_without_unit))
     return min(all_polymers, key=len)
 
 
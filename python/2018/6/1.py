@@ -54,55 +54,78 @@ in this example, the size of the largest area is 17.
 What is the size of the largest area that isn't infinite?
 """
 import math
-from collections import defaultdict
+from collections import Counter
 
-from common import Point, iter_points
+from common import Point
 
 
-def find_closest_point(point, other_points):
-    closest = -1
-    closest_distance = math.inf
+def find_closest_points(special_points, max_column, max_row):
+    """
+    Returns a list for each row up to max_row, giving the index of the
+    closest special point to each of its cells up to max_column, or -1 if
+    there's a tie for closest.
+    """
+    width, height = max_column + 1, max_row + 1
+    closest = [None] * (width * height)
 
-    for i, other_point in enumerate(other_points):
-        if point == other_point:
-            closest = i
-            break
+    # Every special point floods outwards one step at a time, so each cell
+    # is first reached at its distance from the closest ones. A cell reached
+    # by more than one point at once, or from a tied cell, is tied itself.
+    frontier = {p.from_top * width + p.from_left: i
+                for i, p in enumerate(special_points)}
 
-        distance = point.manhattan_disance(other_point)
+    while frontier:
+        for cell, i in frontier.items():
+            closest[cell] = i
 
-        if distance == closest_distance:
-            closest = -1
-        elif distance < closest_distance:
-            closest = i
-            closest_distance = distance
+        next_frontier = {}
 
-    return closest
+        for cell, i in frontier.items():
+            from_left = cell % width
+            neighbours = [cell - width, cell + width]
+
+            if from_left > 0:
+                neighbours.append(cell - 1)
+            if from_left < max_column:
+                neighbours.append(cell + 1)
+
+            for neighbour in neighbours:
+                if 0 <= neighbour < len(closest) and\
+                        closest[neighbour] is None:
+                    next_frontier[neighbour] =\
+                        i if next_frontier.get(neighbour, i) == i else -1
+
+        frontier = next_frontier
+
+    return [closest[row:row + width]
+            for row in range(0, len(closest), width)]
 
 
 def find_belonging_areas(special_points):
-    area_cnt = defaultdict(int)
+    area_cnt = Counter()
 
     min_column = min(special_points, key=lambda p: p.from_left).from_left
     max_column = max(special_points, key=lambda p: p.from_left).from_left
     min_row = min(special_points, key=lambda p: p.from_top).from_top
     max_row = max(special_points, key=lambda p: p.from_top).from_top
 
-    for point in iter_points(max_column, max_row):
-        closest = find_closest_point(point, special_points)
+    closest_points = find_closest_points(special_points, max_column, max_row)
+
+    for closest_row in closest_points:
+        area_cnt.update(closest_row)
 
-        point_on_edge = (
-            (point.from_left == min_column or point.from_left == max_column)
-            or (point.from_top == min_row or point.from_top == max_row))
+    # Anything touching the edges goes on forever, so it can be disregarded
+    # when finding a maximum
+    edges = (closest_points[min_row] + closest_points[max_row] +
+             [closest_row[column]
+              for closest_row in closest_points
+              for column in (min_column, max_column)])
 
-        # If it's not -1, it means it belongs to somebody
-        if closest != -1:
-            if point_on_edge:
-                # This way, adding 1 to it will not matter. And it can be
-                # disregarded when finding a maximum.
-                area_cnt[closest] = -math.inf
-                continue
+    for closest in edges:
+        area_cnt[closest] = -math.inf
 
-            area_cnt[closest] += 1
+    # If it's -1, it doesn't belong to anybody
+    del area_cnt[-1]
 
     return area_cnt
 
@@ -1,25 +1,28 @@
-from common import Point, iter_points
+from bisect import bisect_left
 
+from common import Point
 
-def find_equisum_region(special_points, max_sum):
+
+def find_equisum_region_size(special_points, max_sum):
     max_column = max(special_points, key=lambda p: p.from_left).from_left
     max_row = max(special_points, key=lambda p: p.from_top).from_top
 
-    region_points = []
-
-    for point in iter_points(max_column, max_row):
-        sum_from_all_special_points = \
-            sum(point.manhattan_disance(special_point)
-                for special_point in special_points)
+    # The sum of the distances to every special point splits into a sum over
+    # the columns plus a sum over the rows, so each only has to be worked
+    # out once per column and once per row
+    column_sums = sorted(
+        sum(abs(from_left - p.from_left) for p in special_points)
+        for from_left in range(max_column + 1))
 
-        if sum_from_all_special_points < max_sum:
-            region_points.append(point)
+    row_sums = (
+        sum(abs(from_top - p.from_top) for p in special_points)
+        for from_top in range(max_row + 1))
 
-    return region_points
+    return sum(bisect_left(column_sums, max_sum - row_sum)
+               for row_sum in row_sums)
 
 
 if __name__ == "__main__":
     with open('input.txt') as points:
         points = list(map(Point.from_string, points.readlines()))
-        equisum_region = find_equisum_region(points, max_sum=10000)
-        print(len(equisum_region))
+        print(find_equisum_region_size(points, max_sum=10000))
@@ -39,38 +39,7 @@ So, in this example, the correct order is CABDFE.
 
 In what order should the steps in your instructions be completed?
 """
-from common import build_prereqs_dictionary, build_step_dictionary
-
-
-def order_steps(step_dict):
-    prereq_dict = build_prereqs_dictionary(step_dict)
-
-    step_order = []
-
-    no_prereqs = set(step_dict.keys()) - set(prereq_dict.keys())
-    frontier = no_prereqs
-
-    while True:
-        if not frontier:
-            break
-
-        next_ = min(frontier)
-
-        step_order.append(next_)
-
-        frontier.remove(next_)
-
-        possible_nexts = step_dict[next_]
-
-        for possible_next in possible_nexts:
-            all_prereqs_done =\
-                set.issubset(prereq_dict[possible_next], set(step_order))
-
-            if all_prereqs_done:
-                frontier.add(possible_next)
-
-    return step_order
-
+from common import build_step_dictionary, order_steps
 
 if __name__ == "__main__":
     with open('input.txt') as step_strs:
@@ -43,105 +43,81 @@ steps.
 With 5 workers and the 60+ second step durations described above, how long will
 it take to complete all of the steps?
 """
-import itertools
-import math
-import operator as op
-from collections import namedtuple
-from string import ascii_uppercase
+import heapq
 
-from common import build_prereqs_dictionary, build_step_dictionary
+from common import (build_step_dictionary, count_prereqs, find_ready_steps,
+                    finish_step)
 
 
 class Worker:
-    def __init__(self, id_=None):
-        # Id isn't necessary, just helps keep track of workers in debugging.
+    __slots__ = ('id_', 'task', 'finish_time')
+
+    def __init__(self, id_):
+        # The worker's index in the list of workers, which is what the heap of
+        # finish events stores and breaks ties between workers on.
         self.id_ = id_
         self.task = None
-        self._begin_time = None
+        self.finish_time = None
 
     def assign_task(self, task, current_time_step):
         self.task = task
-        self._begin_time = current_time_step
+
+        # Worked out once here rather than every time the worker is checked
+        if task:
+            self.finish_time = current_time_step + self._time_func(task)
+        else:
+            self.finish_time = None
 
     def clear_task(self):
         self.assign_task(None, None)
 
-    def is_available(self, current_time_step):
-        return self.time_remaining(current_time_step) <= 0
-
-    def time_remaining(self, current_time_step):
-        if not self.task:
-            return -math.inf
-
-        return (self._begin_time + self._time_func()) - current_time_step
-
-    def _time_func(self):
-        return ascii_uppercase.index(self.task.upper()) + 61
-
-
-def get_available_workers(workers, time_step):
-    for worker in workers:
-        if worker.is_available(time_step):
-            yield worker
-
-
-def get_possible_next_tasks(just_finished_tasks, all_done_tasks, step_dict,
-                            prereq_dict):
-    possible_nexts =\
-        sorted(
-            itertools.chain.from_iterable(
-                map(lambda t: step_dict[t], just_finished_tasks)))
-
-    for possible_next in possible_nexts:
-        all_prereqs_done =\
-            set.issubset(prereq_dict[possible_next], set(all_done_tasks))
-
-        if all_prereqs_done:
-            yield possible_next
+    @staticmethod
+    def _time_func(task):
+        return ord(task.upper()) - ord('A') + 61
 
 
 def find_time_to_finish(step_dict, worker_count):
-    prereq_dict = build_prereqs_dictionary(step_dict)
+    prereq_counts = count_prereqs(step_dict)
 
-    step_order = []
+    # The steps that can be done as soon as a worker is available
+    ready = find_ready_steps(prereq_counts)
 
-    no_prereqs = set(step_dict.keys()) - set(prereq_dict.keys())
-
-    # The frontier always contains tasks that either:
-    # a) a worker is currently doing,
-    # b) can be done if a worker is available.
-    frontier = no_prereqs
+    step_order = []
 
     workers = [Worker(id_=i) for i in range(worker_count)]
+    idle_workers = list(workers)
+
+    # The busy workers as (finish time, id), so whichever finishes next is
+    # always at the front instead of every worker being checked each time
+    finish_events = []
 
-    for time_step in itertools.count():
-        if not frontier:
-            # This means there's nothing left that we are doing or can do. So
-            # we finished last time step
-            return (time_step - 1, step_order)
+    time_step = 0
 
-        just_finished_tasks = set()
-        available_workers = []
+    while True:
+        while ready and idle_workers:
+            worker = idle_workers.pop()
+            worker.assign_task(heapq.heappop(ready), time_step)
 
-        for worker in get_available_workers(workers, time_step):
-            available_workers.append(worker)
-            if worker.task:
-                # The worker has just finished working on something.
-                just_finished_tasks.add(worker.task)
+            heapq.heappush(finish_events, (worker.finish_time, worker.id_))
 
-                step_order.append(worker.task)
+        if not finish_events:
+            # This means there's nothing left that we are doing or can do.
+            return (time_step, step_order)
 
-                frontier.remove(worker.task)
+        # Nothing happens until the next worker finishes, so skip straight to
+        # then, and let everyone finishing at that moment go before any new
+        # steps are handed out
+        time_step = finish_events[0][0]
 
-                worker.clear_task()
+        while finish_events and finish_events[0][0] == time_step:
+            _, id_ = heapq.heappop(finish_events)
+            worker = workers[id_]
 
-        for possible_next in get_possible_next_tasks(
-                just_finished_tasks, step_order, step_dict, prereq_dict):
-            frontier.add(possible_next)
+            step_order.append(worker.task)
+            finish_step(worker.task, step_dict, prereq_counts, ready)
 
-        for i, task in enumerate(sorted(frontier)[:len(available_workers)]):
-            if task not in map(op.attrgetter('task'), workers):
-                available_workers[i].assign_task(task, time_step)
+            worker.clear_task()
+            idle_workers.append(worker)
 
 
 if __name__ == "__main__":
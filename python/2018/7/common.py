@@ -1,11 +1,13 @@
-from collections import defaultdict
+import heapq
 import re
+from collections import defaultdict
 
-def parse_step_str(step_str):
-    parts_regex = re.compile(r"Step (?P<prereq>[A-Z]) must be finished" +
-                             r" before step (?P<name>[A-Z]) can begin.")
+STEP_REGEX = re.compile(r"Step (?P<prereq>[A-Z]) must be finished" +
+                        r" before step (?P<name>[A-Z]) can begin.")
 
-    result = parts_regex.match(step_str)
+
+def parse_step_str(step_str):
+    result = STEP_REGEX.match(step_str)
 
     if not result:
         raise ValueError(
@@ -26,11 +28,50 @@ def build_step_dictionary(step_strs):
     return step_dict
 
 
-def build_prereqs_dictionary(step_dict):
-    prereq_dict = defaultdict(set)
+def count_prereqs(step_dict):
+    """
+    Returns how many prerequisites each step has, including the steps that
+    have none.
+    """
+    prereq_counts = {name: 0 for name in step_dict.keys()}
 
-    for prereq, names in step_dict.items():
+    for names in step_dict.values():
         for name in names:
-            prereq_dict[name].add(prereq)
+            prereq_counts[name] = prereq_counts.get(name, 0) + 1
+
+    return prereq_counts
+
+
+def find_ready_steps(prereq_counts):
+    """
+    Returns the steps with no prerequisites left as a heap, so the
+    alphabetically first one is always the one popped.
+    """
+    ready = [name for name, count in prereq_counts.items() if count == 0]
+    heapq.heapify(ready)
+
+    return ready
+
+
+def finish_step(step, step_dict, prereq_counts, ready):
+    # A step becomes ready the moment the last of its prerequisites is done
+    for possible_next in step_dict[step]:
+        prereq_counts[possible_next] -= 1
+
+        if prereq_counts[possible_next] == 0:
+            heapq.heappush(ready, possible_next)
+
+
+def order_steps(step_dict):
+    prereq_counts = count_prereqs(step_dict)
+    ready = find_ready_steps(prereq_counts)
+
+    step_order = []
+
+    while ready:
+        next_ = heapq.heappop(ready)
+
+        step_order.append(next_)
+        finish_step(next_, step_dict, prereq_counts, ready)
 
-    return prereq_dict
+    return step_order
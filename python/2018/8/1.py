@@ -39,20 +39,10 @@ metadata entries. In this example, that sum is 1+1+2+10+11+12+2+99=138.
 
 What is the sum of all metadata entries?
 """
-from common import parse_digits
-
-
-def sum_metadata_entries(node):
-    if not node:
-        return 0
-
-    child_sums = map(sum_metadata_entries, node.child_nodes)
-
-    return sum([*child_sums, *node.metadata_entries])
-
+from common import parse_digits_flat
 
 if __name__ == "__main__":
     with open('input.txt') as digits:
         digit_list = list(map(int, digits.read().strip().split(" ")))
-        root_node = parse_digits(digit_list)
-        print(sum_metadata_entries(root_node))
+        _, metadata = parse_digits_flat(digit_list)
+        print(sum(map(sum, metadata)))
@@ -29,26 +29,27 @@ So, in this example, the value of the root node is 66.
 
 What is the value of the root node?
 """
-from common import Node, parse_digits
+from common import parse_digits_flat
 
 
-def value(node):
-    if not node.child_nodes:
-        return sum(node.metadata_entries)
+def node_values(child_indexes, metadata):
+    values = []
 
-    def indexed_child_nodes():
-        for entry in node.metadata_entries:
-            if (entry == 0 or
-                    entry - 1 >= len(node.child_nodes)):
-                yield Node.empty()
-            else:
-                yield node.child_nodes[entry - 1]
+    # Children come before their parents, so their values are always known
+    # by the time a parent needs them
+    for children, metadata_entries in zip(child_indexes, metadata):
+        if not children:
+            values.append(sum(metadata_entries))
+        else:
+            values.append(sum(values[children[entry - 1]]
+                              for entry in metadata_entries
+                              if 0 < entry <= len(children)))
 
-    return sum(map(value, indexed_child_nodes()))
+    return values
 
 
 if __name__ == "__main__":
     with open('input.txt') as digits:
         digit_list = list(map(int, digits.read().strip().split(" ")))
-        root_node = parse_digits(digit_list)
-        print(value(root_node))
+        child_indexes, metadata = parse_digits_flat(digit_list)
+        print(node_values(child_indexes, metadata)[-1])
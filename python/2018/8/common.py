@@ -1,3 +1,6 @@
+from itertools import islice
+
+
 class Node:
     def __init__(self, child_nodes, metadata_entries):
         self.child_nodes = child_nodes
@@ -23,6 +26,16 @@ class Node:
                 f", metadata_entries={self.metadata_entries})")
 
 
+def take_digits(digit_list, count):
+    # islice just stops early if the digits run out, so check for that
+    digits = tuple(islice(digit_list, count))
+
+    if len(digits) != count:
+        raise ValueError("Digits ran out partway through a node")
+
+    return digits
+
+
 # My original solution that I came up with after way too much thought. Uses the
 # concept of layers to keep every child node and metadata item straight. I
 # thought it was excellent of me to observe that you are only ever reading a
@@ -78,31 +91,53 @@ def parse_digits_complicated(digit_list):
 
 
 # The much, much, much, much, much, much more elegant
-# solution by Micheal Marsalek.
-def parse_digits(digit_list):
+# solution by Micheal Marsalek, with the recursion unrolled
+# onto a stack of the nodes still being read.
+def parse_digits_flat(digit_list):
+    """
+    Parses the tree into two lists with an entry for each node, in the order
+    the nodes finish being read: the indexes of its children, and its
+    metadata entries. Children always finish before their parent, so a node
+    only ever points back at earlier entries, and the root is the last one.
+    """
     # Essentially, this takes the insight I had and really distills it.
-    # I initally knew this would need recursion, but I dismissed it,
-    # thinking it would be impossible to tell when child nodes end
-    # end and the metadata for the parent node begins. But in fact,
-    # by using "no children" as a base case, you realize that a node
+    # By using "no children" as a base case, you realize that a node
     # fundamentally only has a header and metadata. If you continue
-    # going through headers if there are children, you will know for sure
-    # that what you now have is not a header for a child node, but a metadata
-    # value. So here, we...
-
-    # ...take both the header values from beginning,
-    num_children = digit_list.pop(0)
-    num_metadata_entries = digit_list.pop(0)
-
-    # ..go through each child and recurse on it. It'll pop off
-    # its own header values and metadata, so on so forth...
-    child_nodes = [parse_digits(digit_list) for _ in range(num_children)]
-
-    # ... and because lists in Python are essentially pass-by-reference,
-    # this results in *only* our own node's metadata values remaining
-    # for us to pick up. If this node has a sibling, it won't overcollect
-    # the sibling's header values as metadata because it's only concerned
-    # with the scope of its children and metadata.
-    metadata_entries = [digit_list.pop(0) for _ in range(num_metadata_entries)]
-
-    return Node(child_nodes, metadata_entries)
+    # going through headers while there are children left to read, you will
+    # know for sure that what comes after the last child is not a header for
+    # another child node, but a metadata value for the node itself.
+    #
+    # Reading through an iterator rather than popping from the front of the
+    # list keeps this linear, and keeping the nodes on an explicit stack
+    # rather than recursing means deep trees can't hit the recursion limit.
+    digit_list = iter(digit_list)
+
+    child_indexes = []
+    metadata = []
+
+    # Each node still being read is kept as how many children it has left to
+    # read, how many metadata entries it has, and the children read so far.
+    stack = [[*take_digits(digit_list, 2), []]]
+
+    while True:
+        if stack[-1][0]:
+            stack[-1][0] -= 1
+            stack.append([*take_digits(digit_list, 2), []])
+            continue
+
+        # All of this node's children have been read, so only its own
+        # metadata values are left before whatever comes next.
+        _, num_metadata_entries, children = stack.pop()
+
+        metadata_entries = take_digits(digit_list, num_metadata_entries)
+
+        child_indexes.append(tuple(children))
+        metadata.append(metadata_entries)
+
+        if not stack:
+            if next(digit_list, None) is not None:
+                raise ValueError("Digits left over after the root node")
+
+            return (child_indexes, metadata)
+
+        stack[-1][2].append(len(metadata) - 1)
@@ -1,59 +1,44 @@
-import itertools
 import re
-from collections import Counter, UserList, defaultdict, deque
+from collections import Counter, defaultdict, deque
 
+MARBLE_INFO_REGEX = re.compile(r"(?P<num_players>\d+) players; last marble" +
+                               r" is worth (?P<last_marble_points>\d+)" +
+                               r" points")
 
-def parse_marble_info(marble_info_str):
-    parts_regex = re.compile(r"(?P<num_players>\d+) players; last marble" +
-                             r" is worth (?P<last_marble_points>\d+) points")
 
-    result = parts_regex.match(marble_info_str)
+def parse_marble_info(marble_info_str):
+    result = MARBLE_INFO_REGEX.match(marble_info_str)
 
     if not result:
-        return ValueError(
+        raise ValueError(
             f"String {marble_info_str} doesn't look like a marble info string")
 
-    return map(int, result.groups())
-
-
-class CircularList(UserList):
-    def insert(self, index, x):
-        self.data.insert(self.wrap_index(index), x)
-
-    def __getitem__(self, index):
-        return self.data[self.wrap_index(index)]
-
-    def __setitem__(self, index, x):
-        self.data[self.wrap_index(index)] = x
+    return (int(result['num_players']), int(result['last_marble_points']))
 
-    def wrap_index(self, index):
-        return index % len(self.data)
 
-
-# My solution implements the CircularList above, but in fact, as you'll see in
-# the faster solution below, there's already a highly optimized data structure
-# for this. This works for Part 1 but is way too slow for part 2. But I'm proud
-# that I got the logic right.
+# My solution wraps indexes around a plain list by hand, but in fact, as
+# you'll see in the faster solution below, there's already a highly optimized
+# data structure for this. This works for Part 1 but is way too slow for
+# part 2. But I'm proud that I got the logic right.
 def get_winning_player_my_slow(num_players, last_marble_points):
     player_points_counter = Counter()
 
-    marbles_on_board = CircularList([0])
+    marbles_on_board = [0]
     current_marble_index = 0
 
-    marbles_remaining = list(range(1, last_marble_points + 1))
-
-    for player_num in itertools.cycle(range(1, num_players + 1)):
-        if not marbles_remaining:
-            break
-
-        marble_to_place = min(marbles_remaining)
+    # Marbles are placed in order, one per player in turn
+    for marble_to_place in range(1, last_marble_points + 1):
+        player_num = (marble_to_place - 1) % num_players + 1
 
         if marble_to_place % 23 != 0:
-            marbles_on_board.insert(current_marble_index + 2, marble_to_place)
-            current_marble_index = marbles_on_board.index(marble_to_place)
+            # The new marble ends up wherever it was inserted, so there's no
+            # need to search the board for it
+            current_marble_index =\
+                (current_marble_index + 2) % len(marbles_on_board)
+            marbles_on_board.insert(current_marble_index, marble_to_place)
         else:
             seven_marbles_counterclock_index =\
-                marbles_on_board.wrap_index(current_marble_index - 7)
+                (current_marble_index - 7) % len(marbles_on_board)
 
             seven_marbles_counterclock =\
                 marbles_on_board.pop(seven_marbles_counterclock_index)
@@ -63,8 +48,6 @@ def get_winning_player_my_slow(num_players, last_marble_points):
 
             current_marble_index = seven_marbles_counterclock_index
 
-        marbles_remaining.remove(marble_to_place)
-
     return player_points_counter.most_common(1)[0]
 
 
@@ -77,18 +60,23 @@ def get_winning_player_my_slow(num_players, last_marble_points):
 def get_winning_player(num_players, last_marble_points):
     scores = Counter()
     circle = deque([0])
-
-    for marble in range(1, last_marble_points + 1):
-        if marble % 23 == 0:
-            circle.rotate(7)
-            # This is also very clever, I didn't realize that, though it seems
-            # obvious in hindsight, a player X will place a marble Y if and
-            # only if Y % num_players == X. That also caused slowdown, since
-            # I calculated the min() of the marbles remaining every time.
-            scores[marble % num_players] += marble + circle.pop()
-            circle.rotate(-1)
-        else:
-            circle.rotate(-1)
-            circle.append(marble)
+    # Looked up once, since the inner loop calls these millions of times
+    rotate, append, pop = circle.rotate, circle.append, circle.pop
+
+    # Only every 23rd marble scores, so the 22 in between are placed by an
+    # inner loop that doesn't need to check each of them. Any marbles after
+    # the last scoring one can't change the scores, so they're never placed.
+    for scoring_marble in range(23, last_marble_points + 1, 23):
+        for marble in range(scoring_marble - 22, scoring_marble):
+            rotate(-1)
+            append(marble)
+
+        rotate(7)
+        # This is also very clever, I didn't realize that, though it seems
+        # obvious in hindsight, a player X will place a marble Y if and
+        # only if Y % num_players == X. That also caused slowdown, since
+        # I calculated the min() of the marbles remaining every time.
+        scores[scoring_marble % num_players] += scoring_marble + pop()
+        rotate(-1)
 
     return scores.most_common(1)[0]